@@ -8,17 +8,26 @@ Usage:
     python -m oura_rings.cli --residents 1 2 3         # Process specific residents
     python -m oura_rings.cli --start 2025-10-01 --end 2025-10-30  # Custom date range
     python -m oura_rings.cli --export-bq --no-dry-run  # Enable BigQuery export
+    python -m oura_rings.cli --max-parallel 2          # Limit concurrent residents
+    python -m oura_rings.cli --resume                  # Skip residents already done
 """
 
+import os
 import sys
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from oura_collector import process_resident, create_summary_report
+from oura_collector import (
+    completed_residents,
+    create_summary_report,
+    exported_tables,
+    process_resident,
+)
 from oura_import_options import (
     RESIDENTS_TO_PROCESS,
     DATE_CONFIG,
@@ -69,11 +78,39 @@ def main(args=None):
         type=str,
         help="Override output directory (default: from config)",
     )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        help="Oura API requests per minute per resident token (default: from config)",
+    )
+    parser.add_argument(
+        "--retry-max",
+        type=int,
+        help="Attempts per Oura request before giving up on throttling (default: from config)",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=4,
+        help="Residents processed concurrently; keep below Oura's rate limits (default: 4)",
+    )
+    parser.add_argument(
+        "--bq-buffer-mb",
+        type=float,
+        help="Frames buffered before an early BigQuery load (default: 256)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip residents a previous run over the same dates completed",
+    )
 
     parsed = parser.parse_args(args)
 
-    # Use config or override from CLI
-    residents = parsed.residents if parsed.residents else RESIDENTS_TO_PROCESS
+    # Use config or override from CLI; a resident listed twice is fetched once
+    residents = list(
+        dict.fromkeys(parsed.residents if parsed.residents else RESIDENTS_TO_PROCESS)
+    )
     date_params = {
         "start_date": parsed.start if parsed.start else DATE_CONFIG["start_date"],
         "end_date": parsed.end if parsed.end else DATE_CONFIG["end_date"],
@@ -88,6 +125,10 @@ def main(args=None):
         options["export_to_bigquery"] = True
     if parsed.no_dry_run:
         options["bq_dry_run"] = False
+    if parsed.rpm is not None:
+        options["oura_requests_per_minute"] = parsed.rpm
+    if parsed.retry_max is not None:
+        options["oura_max_retries"] = parsed.retry_max
 
     logger.info("=" * 60)
     logger.info("STARTING BATCH OURA RING DATA PROCESSING")
@@ -103,24 +144,107 @@ def main(args=None):
     # Setup output directory
     output_base.mkdir(parents=True, exist_ok=True)
 
-    # Process all residents
-    results = []
-    for resident_no in residents:
-        result = process_resident(
-            resident_no,
-            date_params,
-            output_base,
-            PATHS,
-            options,
-            DATA_TYPES,
-            OURA_BQ,
+    previous = {}
+    already_loaded = {}
+    if parsed.resume:
+        # The earlier summary may cover residents this run did not request.
+        requested = set(residents)
+        previous = {
+            r: result
+            for r, result in completed_residents(output_base, date_params, options).items()
+            if r in requested
+        }
+        already_loaded = {
+            r: tables
+            for r, tables in exported_tables(output_base, date_params, options).items()
+            if r in requested
+        }
+        if previous:
+            logger.info(f"Resuming: skipping completed residents {sorted(previous)}")
+    pending_residents = [r for r in residents if r not in previous]
+
+    # Queue every resident's frames and load each table once at the end,
+    # instead of one load job per table per resident.
+    bq_batch = None
+    if options.get("export_to_bigquery"):
+        from oura_bigquery_loader import DEFAULT_BATCH_FLUSH_BYTES, FrameBatch
+
+        bq_batch = FrameBatch(
+            dataset=OURA_BQ.get("dataset", "oura"),
+            table_prefix=OURA_BQ.get("table_prefix", "oura"),
+            project=os.getenv(OURA_BQ.get("project_env", "BQ_PROJECT")) or None,
+            location=OURA_BQ.get("location", os.getenv("BQ_LOCATION", "US")),
+            dry_run=bool(options.get("bq_dry_run", True)),
+            flush_bytes=(
+                int(parsed.bq_buffer_mb * 1024 * 1024)
+                if parsed.bq_buffer_mb is not None
+                else DEFAULT_BATCH_FLUSH_BYTES
+            ),
+            already_loaded=already_loaded,
         )
-        results.append(result)
 
-        # Continue on error if configured
-        if result["status"] == "error" and not options.get("continue_on_error"):
-            logger.error("Stopping processing due to error and continue_on_error=False")
-            break
+    # Process residents concurrently: each is independent (own PAT, own files)
+    # and almost all of the time goes to waiting on the Oura API.
+    results = list(previous.values())
+    with ThreadPoolExecutor(max_workers=max(1, parsed.max_parallel)) as pool:
+        futures = [
+            pool.submit(
+                process_resident,
+                resident_no,
+                date_params,
+                output_base,
+                PATHS,
+                options,
+                DATA_TYPES,
+                OURA_BQ,
+                bq_batch,
+            )
+            for resident_no in pending_residents
+        ]
+        stopping = False
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            # Residents already running when we stop still finish (and queue
+            # their frames), so keep collecting them rather than breaking out.
+            result = future.result()
+            results.append(result)
+
+            # Continue on error if configured
+            if (
+                result["status"] == "error"
+                and not options.get("continue_on_error")
+                and not stopping
+            ):
+                logger.error(
+                    "Stopping processing due to error and continue_on_error=False"
+                )
+                stopping = True
+                for pending in futures:
+                    pending.cancel()
+
+    if bq_batch is not None:
+        bq_totals = bq_batch.flush()
+        logger.info(
+            f"BigQuery export (dry_run={options.get('bq_dry_run', True)}): {bq_totals}"
+        )
+        # Replace the queued counts with what each upload actually loaded, so
+        # --resume retries only the tables that failed and never re-appends
+        # the ones that landed.
+        for result in results:
+            if result["resident"] in previous or result["status"] != "success":
+                continue
+            loaded, failed = bq_batch.export_status(result["resident"])
+            result["bq_export"] = loaded or None
+            if failed:
+                result["bq_export_failed"] = failed
+                logger.error(
+                    f"BigQuery export failed for resident {result['resident']}: {failed}"
+                )
+
+    # Report in requested order regardless of completion order
+    order = {resident_no: i for i, resident_no in enumerate(residents)}
+    results.sort(key=lambda r: order[r["resident"]])
 
     # Create summary
     create_summary_report(
@@ -20,16 +20,19 @@ Charts included
 Usage
 -----
     cd oura-rings/
-    python generate_health_dashboard.py [--days 90] [--residents 1,2,3] [--output ../dashboard/resident_health_dashboard.html]
+    python generate_health_dashboard.py [--days 90] [--residents 1,2,3] [--output ../dashboard/resident_health_dashboard.html] [--max-parallel 4]
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
@@ -45,6 +48,9 @@ log = logging.getLogger(__name__)
 SCRIPT_DIR = Path(__file__).parent
 PATS_DIR = SCRIPT_DIR / "pats"
 DEFAULT_OUTPUT = SCRIPT_DIR.parent / "dashboard" / "resident_health_dashboard.html"
+ENV_CACHE_DIR = Path.home() / ".cache" / "durham-env"
+# Cache files older than this are pruned whenever a new result is cached.
+ENV_CACHE_MAX_AGE_DAYS = 7
 
 # All resident numbers that have PAT files
 ALL_RESIDENTS = sorted(
@@ -79,21 +85,52 @@ def fetch_resident_data(
     data: dict[str, Any] = {}
     try:
         with OuraClient(token) as client:
-            log.info(f"  R{resident_no}: daily sleep")
-            data["daily_sleep"] = client.get_daily_sleep(**params)
-            log.info(f"  R{resident_no}: sleep periods")
-            data["sleep_periods"] = client.get_sleep_periods(**params)
-            log.info(f"  R{resident_no}: readiness")
-            data["readiness"] = client.get_daily_readiness(**params)
-            log.info(f"  R{resident_no}: activity")
-            data["activity"] = client.get_daily_activity(**params)
-            log.info(f"  R{resident_no}: heart rate")
-            data["heart_rate"] = client.get_heart_rate(**params)
+            endpoints = {
+                "daily_sleep": client.get_daily_sleep,
+                "sleep_periods": client.get_sleep_periods,
+                "readiness": client.get_daily_readiness,
+                "activity": client.get_daily_activity,
+                "heart_rate": client.get_heart_rate,
+            }
+            # The endpoints are independent, so overlap their HTTP round trips.
+            with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+                futures = {
+                    key: pool.submit(fetch, **params)
+                    for key, fetch in endpoints.items()
+                }
+                for key, future in futures.items():
+                    try:
+                        data[key] = future.result()
+                        log.info(f"  R{resident_no}: {key.replace('_', ' ')}")
+                    except Exception as exc:
+                        log.error(f"  R{resident_no}: API error ({key}) — {exc}")
     except Exception as exc:
         log.error(f"  R{resident_no}: API error — {exc}")
     return data
 
 
+def fetch_resident_frame(
+    resident_no: int, start_date: str, end_date: str
+) -> pd.DataFrame | None:
+    """
+    Fetch one resident and flatten it straight away.
+
+    Run inside the fetch workers so each resident's transform overlaps the
+    other residents' HTTP waits, and the raw payload is dropped as soon as it
+    is flattened. The transform is one light pass over the JSON, so shipping
+    it to a process pool would cost more in pickling than it saves.
+    """
+    raw = fetch_resident_data(resident_no, start_date, end_date)
+    if not raw:
+        return None
+    df = build_daily_df(raw, resident_no)
+    if df.empty:
+        log.warning(f"Resident {resident_no} → empty after transform")
+        return None
+    log.info(f"Resident {resident_no} → {len(df)} days of data")
+    return df
+
+
 # ──────────────────────────────────────────────
 # Data transformation
 # ──────────────────────────────────────────────
@@ -188,30 +225,83 @@ def build_daily_df(raw: dict[str, Any], resident_no: int) -> pd.DataFrame:
 # ──────────────────────────────────────────────
 
 
-def fetch_env_data(start_date: str, end_date: str) -> pd.DataFrame:
-    """Pull daily indoor temperature per residence from BigQuery."""
+def _prune_env_cache() -> None:
+    """Remove cached env results older than ENV_CACHE_MAX_AGE_DAYS."""
+    cutoff = time.time() - ENV_CACHE_MAX_AGE_DAYS * 86400
+    for path in ENV_CACHE_DIR.glob("env_*.parquet"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def fetch_env_data(
+    start_date: str, end_date: str, refresh: bool = False
+) -> pd.DataFrame:
+    """Pull daily indoor temperature per residence from BigQuery.
+
+    Results are cached as Parquet under ENV_CACHE_DIR, keyed on the project,
+    query, date range and the source table's `modified` time, so new rows
+    (e.g. later today) invalidate the cache; pass refresh=True to re-query.
+    """
     try:
         from google.cloud import bigquery  # type: ignore
 
         project = os.environ.get("GCP_PROJECT_ID", "durham-weather-466502")
-        client = bigquery.Client(project=project)
+        table_id = f"{project}.sensors_shared.residence_readings_daily"
         query = f"""
         SELECT
-          DATE(day_ts)  AS day,
+          DATETIME(DATE(day_ts)) AS day,
           residence_id,
           ROUND(AVG(avg_value), 1) AS indoor_temp_f
-        FROM `{project}.sensors_shared.residence_readings_daily`
+        FROM `{table_id}`
         WHERE sensor_role = 'Indoor'
           AND metric_name = 'temperature'
-          AND day_ts BETWEEN '{start_date}' AND '{end_date}'
+          AND day_ts BETWEEN TIMESTAMP(@start_date) AND TIMESTAMP(@end_date)
         GROUP BY 1, 2
         ORDER BY 1, 2
         """
-        df = client.query(query).to_dataframe()
-        df["day"] = pd.to_datetime(df["day"])
+        client = bigquery.Client(project=project)
+        # A cheap metadata lookup; without a modified time, skip the cache.
+        modified = client.get_table(table_id).modified
+        cache_path = None
+        if modified:
+            cache_key = hashlib.sha1(
+                f"{project}|{modified.isoformat()}|{query}|{start_date}|{end_date}".encode(
+                    "utf-8"
+                )
+            ).hexdigest()[:16]
+            cache_path = ENV_CACHE_DIR / f"env_{cache_key}.parquet"
+        if not refresh and cache_path is not None and cache_path.exists():
+            df = pd.read_parquet(cache_path)
+            log.info(f"BigQuery: {len(df)} rows of env data (cached {cache_path})")
+            return df
+
+        # Dates as parameters keep the query text stable for BigQuery's result cache.
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+                bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+            ]
+        )
+        # Stream via the BigQuery Storage Read API (Arrow) when the result is
+        # larger than the first page; small results still come back over REST.
+        df = client.query(query, job_config=job_config).to_dataframe(
+            create_bqstorage_client=True
+        )
+        # day is a DATETIME, so it already arrives as tz-naive datetime64 and
+        # lines up with the Oura frames without a to_datetime pass.
         # Map residence_id (R1..R13) to resident label
         df["resident"] = df["residence_id"]
         log.info(f"BigQuery: {len(df)} rows of env data")
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                df.to_parquet(cache_path, compression="zstd", index=False)
+                _prune_env_cache()
+            except (OSError, ValueError) as exc:
+                log.warning(f"Could not write env data cache {cache_path}: {exc}")
         return df
     except Exception as exc:
         log.warning(
@@ -303,11 +393,13 @@ def make_band_traces(
     band_color: str = "rgba(100,100,200,0.15)",
 ) -> list[dict]:
     """Cross-resident min/max/avg band."""
-    grp = combined.dropna(subset=[y_col]).groupby("day")[y_col]
-    days = grp.mean().index.strftime("%Y-%m-%d").tolist()
-    mn = grp.min().tolist()
-    mx = grp.max().tolist()
-    avg = grp.mean().round(1).tolist()
+    stats = combined.dropna(subset=[y_col]).groupby("day")[y_col].agg(
+        ["mean", "min", "max"]
+    )
+    days = stats.index.strftime("%Y-%m-%d").tolist()
+    mn = stats["min"].tolist()
+    mx = stats["max"].tolist()
+    avg = stats["mean"].round(1).tolist()
     return [
         {
             "type": "scatter",
@@ -385,26 +477,38 @@ def make_box_traces(
     return traces
 
 
+def prepare_env_states(env: pd.DataFrame) -> pd.DataFrame:
+    """Indoor temps labelled with a thermal state; rows without a temperature dropped.
+
+    Missing temperatures would otherwise fall through _temp_to_state's
+    comparisons into "Hot".
+    """
+    env_slim = env[["resident", "day", "indoor_temp_f"]].dropna(
+        subset=["indoor_temp_f"]
+    )
+    return env_slim.assign(
+        thermal_state=env_slim["indoor_temp_f"].apply(_temp_to_state)
+    )
+
+
 def make_scatter_corr_traces(
     health: pd.DataFrame,
-    env: pd.DataFrame,
+    env_states: pd.DataFrame,
     y_col: str,
     residents: list[str],
 ) -> list[dict]:
-    """Scatter of env indoor temp vs health metric, coloured by thermal state."""
+    """Scatter of env indoor temp vs health metric, coloured by thermal state.
+
+    env_states is the output of prepare_env_states, shared across metrics.
+    """
     traces: list[dict] = []
     # Align on resident + day
     health_slim = health[["resident", "day", y_col]].dropna()
     # Try to match R1..R13 from env to resident labels
-    merged = health_slim.merge(
-        env[["resident", "day", "indoor_temp_f"]],
-        on=["resident", "day"],
-        how="inner",
-    )
+    merged = health_slim.merge(env_states, on=["resident", "day"], how="inner")
     if merged.empty:
         return []
 
-    merged["thermal_state"] = merged["indoor_temp_f"].apply(_temp_to_state)
     for state, color in THERMAL_COLORS.items():
         sub = merged[merged["thermal_state"] == state]
         if sub.empty:
@@ -436,6 +540,12 @@ def build_html(
     residents = (
         sorted(combined["resident"].unique().tolist()) if not combined.empty else []
     )
+    if not combined.empty:
+        # Every chart filters by resident; as a categorical those masks compare
+        # integer codes instead of strings row by row.
+        combined = combined.assign(
+            resident=pd.Categorical(combined["resident"], categories=residents)
+        )
 
     def layout(title: str, xlab: str = "Date", ylab: str = "") -> dict:
         return {
@@ -603,8 +713,12 @@ def build_html(
             )
 
         # 10 & 11. Environmental correlation
-        if not env.empty:
-            corr_hrv = make_scatter_corr_traces(combined, env, "hrv_sleep", residents)
+        # Thermal states are computed once and shared by both correlation panels.
+        env_states = prepare_env_states(env) if not env.empty else env
+        if not env_states.empty:
+            corr_hrv = make_scatter_corr_traces(
+                combined, env_states, "hrv_sleep", residents
+            )
             if corr_hrv:
                 c["hrv_temp"] = chart_block(
                     {
@@ -621,7 +735,7 @@ def build_html(
                     "chart_hrv_temp",
                 )
             corr_sleep = make_scatter_corr_traces(
-                combined, env, "sleep_score", residents
+                combined, env_states, "sleep_score", residents
             )
             if corr_sleep:
                 c["sleep_temp"] = chart_block(
@@ -750,6 +864,17 @@ def build_html(
 # ──────────────────────────────────────────────
 
 
+def dashboard_inputs_key(combined: pd.DataFrame, env: pd.DataFrame, days: int) -> str:
+    """Content hash of everything that feeds build_html (data, --days, this script)."""
+    h = hashlib.sha1()
+    h.update(Path(__file__).read_bytes())
+    h.update(str(days).encode("utf-8"))
+    for df in (combined, env):
+        h.update(",".join(map(str, df.columns)).encode("utf-8"))
+        h.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return h.hexdigest()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate resident health dashboard HTML."
@@ -769,6 +894,22 @@ def main() -> None:
     parser.add_argument(
         "--no-bq", action="store_true", help="Skip BigQuery env data fetch"
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-query BigQuery env data instead of using the local Parquet cache",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild the HTML even if the input data is unchanged since the last run",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=4,
+        help="Residents fetched concurrently (default 4)",
+    )
     args = parser.parse_args()
 
     end_date = date.today().isoformat()
@@ -783,17 +924,26 @@ def main() -> None:
     log.info(f"Fetching data for {len(target)} resident(s): {target}")
     log.info(f"Date range: {start_date} → {end_date}")
 
+    # The BigQuery env query is independent of the Oura API calls, so run it
+    # in the background while residents are fetched.
+    env_pool = ThreadPoolExecutor(max_workers=1)
+    env_future = None
+    if not args.no_bq:
+        log.info("Fetching environmental data from BigQuery…")
+        env_future = env_pool.submit(
+            fetch_env_data, start_date, end_date, args.refresh
+        )
+
+    # Residents are independent (own PAT, own rate limit), so fetch several
+    # at once; map() hands results back in target order.
     all_frames: list[pd.DataFrame] = []
-    for res_no in target:
-        log.info(f"Resident {res_no}")
-        raw = fetch_resident_data(res_no, start_date, end_date)
-        if raw:
-            df = build_daily_df(raw, res_no)
-            if not df.empty:
+    with ThreadPoolExecutor(max_workers=max(1, args.max_parallel)) as pool:
+        built = pool.map(
+            lambda res_no: fetch_resident_frame(res_no, start_date, end_date), target
+        )
+        for df in built:
+            if df is not None:
                 all_frames.append(df)
-                log.info(f"  → {len(df)} days of data")
-            else:
-                log.warning("  → empty after transform")
 
     combined = (
         pd.concat(all_frames, ignore_index=True) if all_frames else pd.DataFrame()
@@ -802,12 +952,22 @@ def main() -> None:
         f"Combined: {len(combined)} rows, {combined['resident'].nunique() if not combined.empty else 0} residents"
     )
 
-    env = pd.DataFrame()
-    if not args.no_bq:
-        log.info("Fetching environmental data from BigQuery…")
-        env = fetch_env_data(start_date, end_date)
-
-    build_html(combined, env, output, args.days)
+    env = env_future.result() if env_future is not None else pd.DataFrame()
+    env_pool.shutdown()
+
+    # Skip re-rendering when the inputs match the ones the existing HTML was built from.
+    key_path = output.with_name(f".{output.name}.cache_key")
+    inputs_key = dashboard_inputs_key(combined, env, args.days)
+    if (
+        not args.force
+        and output.exists()
+        and key_path.exists()
+        and key_path.read_text(encoding="utf-8").strip() == inputs_key
+    ):
+        log.info(f"Inputs unchanged since last build — keeping {output}")
+    else:
+        build_html(combined, env, output, args.days)
+        key_path.write_text(inputs_key, encoding="utf-8")
     print(f"\n✅  Dashboard ready: {output}")
     print(f"   Open in browser: open {output}")
 
@@ -22,12 +22,31 @@ Usage pattern:
 """
 
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+import logging
 import os
+import threading
 import pandas as pd
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
 
+logger = logging.getLogger(__name__)
+
+
+class BigQueryLoadError(RuntimeError):
+    """
+    Some tables' load jobs failed.
+
+    ``failed`` maps table name -> exception; ``loaded`` maps the tables whose
+    jobs did complete to rows appended, so callers can tell what landed.
+    """
+
+    def __init__(self, failed: Dict[str, BaseException], loaded: Dict[str, int]):
+        super().__init__(f"BigQuery load failed for: {', '.join(sorted(failed))}")
+        self.failed = failed
+        self.loaded = loaded
+
+
 # Reuse the small flattener from batch module at runtime import to avoid circular import
 
 
@@ -123,7 +142,8 @@ def upload_frames_to_bigquery(
     - location: optional BQ location (defaults to env BQ_LOCATION or 'US')
     - dry_run: when True, does not perform network calls, returns row counts
 
-    Returns a mapping of table_name -> rows uploaded (or would upload, for dry-run)
+    Returns a mapping of table_name -> rows uploaded (or would upload, for dry-run).
+    Raises BigQueryLoadError if any table's job fails, after waiting on the rest.
     """
     project = project or os.getenv("BQ_PROJECT") or None
     location = location or os.getenv("BQ_LOCATION", "US")
@@ -147,18 +167,193 @@ def upload_frames_to_bigquery(
     client = bigquery.Client(project=project, location=location)
     _ensure_dataset(client, dataset)
 
+    # Start every table's job before waiting on any, so the tables ingest in
+    # parallel. load_table_from_dataframe sends Snappy Parquet and coerces the
+    # frame to an existing table's schema (e.g. the naive ``day`` datetime).
+    job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+    )
+    jobs = []
+    failed: Dict[str, BaseException] = {}
     for name, df in frames.items():
         if df.empty:
             continue
         table_name = f"{table_prefix}_{name}"
         table_ref = client.dataset(dataset).table(table_name)
-        job = client.load_table_from_dataframe(df, table_ref)
-        job.result()
-        results[table_name] = int(len(df))
+        try:
+            job = client.load_table_from_dataframe(df, table_ref, job_config=job_config)
+        except Exception as e:
+            failed[table_name] = e
+            continue
+        jobs.append((table_name, job, int(len(df))))
+
+    # Wait on every job even after one fails: the others may still append,
+    # and the caller needs to know which tables did.
+    for table_name, job, rows in jobs:
+        try:
+            job.result()
+        except Exception as e:
+            failed[table_name] = e
+            continue
+        results[table_name] = rows
 
+    if failed:
+        raise BigQueryLoadError(failed, results)
     return results
 
 
+# Pending bytes across all tables before FrameBatch uploads early instead of
+# waiting for flush(); bounds the memory a long multi-resident run can hold.
+DEFAULT_BATCH_FLUSH_BYTES = 256 * 1024 * 1024
+
+
+class FrameBatch:
+    """
+    Accumulate daily frames from many residents and upload each table once.
+
+    Every load job carries seconds of fixed overhead and counts against the
+    daily load quota, so a batch run issues one job per table rather than one
+    per table per resident. Safe to share across worker threads.
+
+    Memory is bounded: once pending frames reach ``flush_bytes`` the adding
+    thread uploads them, and other adders block until that upload finishes
+    rather than buffering past the budget while it runs.
+
+    Each upload's outcome is recorded per resident and table, so after
+    flush() export_status() reports exactly what reached BigQuery. Tables in
+    ``already_loaded`` (resident -> table_name -> rows, e.g. from a resumed
+    run) are skipped by add() and reported as loaded.
+    """
+
+    def __init__(
+        self,
+        dataset: str,
+        table_prefix: str = "oura",
+        project: str | None = None,
+        location: str | None = None,
+        dry_run: bool = True,
+        flush_bytes: int = DEFAULT_BATCH_FLUSH_BYTES,
+        already_loaded: Dict[int, Dict[str, int]] | None = None,
+    ):
+        self.dataset = dataset
+        self.table_prefix = table_prefix
+        self.project = project
+        self.location = location
+        self.dry_run = dry_run
+        self.flush_bytes = flush_bytes
+        # name -> [(resident, frame)], so each upload knows whose rows it carries
+        self._pending: Dict[str, List[Tuple[int, pd.DataFrame]]] = {}
+        self._pending_bytes = 0
+        self._uploading = False
+        self._results: Dict[str, int] = {}
+        self._loaded: Dict[int, Dict[str, int]] = {
+            resident: dict(tables) for resident, tables in (already_loaded or {}).items()
+        }
+        self._failed: Dict[int, set] = {}
+        self._cond = threading.Condition()
+
+    def add(self, frames: Dict[str, pd.DataFrame], resident: int) -> Dict[str, int]:
+        """Queue one resident's frames for upload; returns table_name -> rows queued."""
+        queued: Dict[str, int] = {}
+        with self._cond:
+            # Backpressure: the buffer is full and already being drained.
+            while self._uploading and self._pending_bytes >= self.flush_bytes:
+                self._cond.wait()
+            done = self._loaded.get(resident, {})
+            for name, df in frames.items():
+                table_name = f"{self.table_prefix}_{name}"
+                if df.empty or table_name in done:
+                    continue
+                self._pending.setdefault(name, []).append((resident, df))
+                self._pending_bytes += int(df.memory_usage(deep=True).sum())
+                queued[table_name] = int(len(df))
+            ready = (
+                self._take_pending()
+                if self._pending_bytes >= self.flush_bytes and not self._uploading
+                else None
+            )
+        if ready:
+            self._upload(ready)
+        return queued
+
+    def flush(self) -> Dict[str, int]:
+        """Upload everything still pending; returns cumulative rows per table."""
+        with self._cond:
+            while self._uploading:
+                self._cond.wait()
+            ready = self._take_pending() if self._pending else None
+        if ready:
+            self._upload(ready)
+        with self._cond:
+            return dict(self._results)
+
+    def export_status(self, resident: int) -> Tuple[Dict[str, int], List[str]]:
+        """Tables loaded for a resident (name -> rows) and tables that failed."""
+        with self._cond:
+            return (
+                dict(self._loaded.get(resident, {})),
+                sorted(self._failed.get(resident, ())),
+            )
+
+    def _take_pending(self) -> Dict[str, List[Tuple[int, pd.DataFrame]]]:
+        # Caller holds self._cond.
+        ready, self._pending = self._pending, {}
+        self._pending_bytes = 0
+        self._uploading = True
+        return ready
+
+    def _upload(self, chunks: Dict[str, List[Tuple[int, pd.DataFrame]]]) -> None:
+        # Failures are recorded per resident rather than raised: an early
+        # flush runs on whichever worker's add() crossed the budget, and the
+        # rows it carries belong to other residents too.
+        try:
+            frames = {
+                name: pd.concat([df for _, df in entries], ignore_index=True)
+                for name, entries in chunks.items()
+            }
+            results = upload_frames_to_bigquery(
+                frames,
+                dataset=self.dataset,
+                table_prefix=self.table_prefix,
+                project=self.project,
+                location=self.location,
+                dry_run=self.dry_run,
+            )
+        except BigQueryLoadError as e:
+            logger.error(f"BigQuery batch upload partly failed: {e}")
+            results = e.loaded
+        except Exception:
+            logger.error("BigQuery batch upload failed", exc_info=True)
+            results = {}
+        except BaseException:
+            # e.g. KeyboardInterrupt: still end the upload so waiters wake.
+            self._record(chunks, {})
+            raise
+        self._record(chunks, results)
+
+    def _record(
+        self, chunks: Dict[str, List[Tuple[int, pd.DataFrame]]], results: Dict[str, int]
+    ) -> None:
+        # Record outcomes and end the upload under one lock, so a flush() or
+        # export_status() woken by the notify always sees this upload.
+        with self._cond:
+            for name, entries in chunks.items():
+                table_name = f"{self.table_prefix}_{name}"
+                loaded = table_name in results
+                if loaded:
+                    self._results[table_name] = (
+                        self._results.get(table_name, 0) + results[table_name]
+                    )
+                for resident, df in entries:
+                    if loaded:
+                        self._loaded.setdefault(resident, {})[table_name] = int(len(df))
+                    else:
+                        self._failed.setdefault(resident, set()).add(table_name)
+            self._uploading = False
+            self._cond.notify_all()
+
+
 def export_daily_to_bigquery(
     resident_no: int,
     data: Dict[str, Any],
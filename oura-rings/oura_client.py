@@ -6,24 +6,185 @@ Handles authentication and API requests to Oura Ring API v2.
 
 from __future__ import annotations
 
-import requests
+import threading
+import time
+from contextlib import contextmanager
 from datetime import date, timedelta
-from typing import Any
+from typing import Any, Iterator
+
+import requests
+from requests.adapters import HTTPAdapter
 
 
 API_URL = "https://api.ouraring.com"
+# Statuses that mean "slow down" rather than "this request is wrong".
+THROTTLE_STATUSES = frozenset({429, 502, 503})
+# Statuses that mean the token itself was rejected; retrying cannot help.
+AUTH_FAILURE_STATUSES = frozenset({401, 403})
+# Conservative per-token request budget; rejected requests still count
+# against Oura's quota, so staying under it beats backing off after 429s.
+DEFAULT_REQUESTS_PER_MINUTE = 300
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests/second after a burst."""
+
+    def __init__(self, rate: float, burst: float = 10.0):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until this caller's request slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            paused = max(self._resume_at - now, 0.0)
+            if self.rate <= 0:
+                wait = paused
+            else:
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                # Reserve a token even if the bucket goes negative; the deficit
+                # is how long this caller waits behind earlier reservations.
+                self._tokens -= 1
+                deficit = -self._tokens / self.rate if self._tokens < 0 else 0.0
+                wait = paused + deficit
+        if wait:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds``, e.g. when the server sends Retry-After."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+_token_buckets: dict[str, TokenBucket] = {}
+_token_buckets_lock = threading.Lock()
+
+
+def rate_limiter_for(token: str, requests_per_minute: float) -> TokenBucket:
+    """Return the bucket shared by every client using ``token``.
+
+    Oura enforces quotas per personal access token, so clients for the same
+    token must draw from one budget.
+    """
+    with _token_buckets_lock:
+        bucket = _token_buckets.get(token)
+        if bucket is None:
+            bucket = TokenBucket(requests_per_minute / 60.0)
+            _token_buckets[token] = bucket
+        return bucket
+
+
+def _quota_nearly_exhausted(headers) -> bool:
+    """True when x-ratelimit-remaining is under 10% of x-ratelimit-limit (or 0)."""
+    try:
+        remaining = float(headers.get("x-ratelimit-remaining"))
+    except (TypeError, ValueError):
+        return False
+    try:
+        limit = float(headers.get("x-ratelimit-limit"))
+    except (TypeError, ValueError):
+        return remaining <= 0
+    return remaining < 0.1 * limit
+
+
+class AIMDController:
+    """Adaptive cap on in-flight requests to one API token.
+
+    Additive increase while responses are fast and successful; multiplicative
+    decrease on throttling, 5xx overload, an exhausted rate-limit header, or
+    latency above ``target_latency``. Tracks the server's real limit instead of
+    a fixed guess, so concurrent fetches neither idle nor trigger retry storms.
+    """
+
+    def __init__(
+        self,
+        initial: float = 2.0,
+        minimum: float = 1.0,
+        maximum: float = 16.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        target_latency: float = 5.0,
+    ):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+        self._in_flight = 0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the currently allowed in-flight request slots."""
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def observe(self, latency: float, response: requests.Response) -> None:
+        """Adjust the limit from one completed request."""
+        with self._cond:
+            if (
+                response.status_code in THROTTLE_STATUSES
+                or _quota_nearly_exhausted(response.headers)
+                or latency > self.target_latency
+            ):
+                self.limit = max(self.minimum, self.limit * self.decrease)
+            else:
+                self.limit = min(self.maximum, self.limit + self.increase)
+            self._cond.notify_all()
+
+
+class OuraAuthError(requests.HTTPError):
+    """The Oura API rejected the personal access token (401/403)."""
 
 
 class OuraClient:
     """Make requests to the Oura API."""
 
-    def __init__(self, personal_access_token: str):
+    MAX_RETRIES = 5
+
+    def __init__(
+        self,
+        personal_access_token: str,
+        requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+        max_retries: int | None = None,
+    ):
         """Initialize a Requests session for making API requests."""
         self._personal_access_token: str = personal_access_token
+        self.max_retries = self.MAX_RETRIES if max_retries is None else max_retries
         self.session = requests.Session()
         self.session.headers.update(
             {"Authorization": f"Bearer {self._personal_access_token}"}
         )
+        self.controller = AIMDController()
+        # One keep-alive pool for api.ouraring.com, sized to the most requests
+        # the controller will ever allow in flight, so concurrent endpoint
+        # fetches reuse TLS connections instead of discarding overflow ones.
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=int(self.controller.maximum)),
+        )
+        self.rate_limiter = rate_limiter_for(
+            personal_access_token, requests_per_minute
+        )
+        # Set on the first 401/403; every later request fails fast instead of
+        # spending quota on a token that is revoked or expired.
+        self._auth_failure: str | None = None
 
     def __enter__(self) -> "OuraClient":
         return self
@@ -120,11 +281,45 @@ class OuraClient:
         return response_data
 
     def _make_request(self, method, url_slug, **kwargs) -> dict[str, Any]:
-        response = self.session.request(
-            method=method, url=f"{API_URL}/{url_slug}", timeout=60, **kwargs
-        )
-        response.raise_for_status()
-        return response.json()
+        attempts = max(1, self.max_retries)
+        for attempt in range(1, attempts + 1):
+            if self._auth_failure is not None:
+                raise OuraAuthError(self._auth_failure)
+            # Wait for quota before taking an in-flight slot so a queued
+            # request never holds concurrency it cannot use yet.
+            self.rate_limiter.acquire()
+            with self.controller.slot():
+                started = time.monotonic()
+                response = self.session.request(
+                    method=method, url=f"{API_URL}/{url_slug}", timeout=60, **kwargs
+                )
+                self.controller.observe(time.monotonic() - started, response)
+            if response.status_code in THROTTLE_STATUSES and attempt < attempts:
+                # Pause the token's shared limiter rather than just this
+                # thread, so sibling requests wait out the same window instead
+                # of each collecting their own 429.
+                self.rate_limiter.pause(self._retry_delay(response, attempt))
+                continue
+            if response.status_code in AUTH_FAILURE_STATUSES:
+                self._auth_failure = (
+                    f"Oura rejected the access token ({response.status_code}) "
+                    f"on {url_slug}"
+                )
+                raise OuraAuthError(self._auth_failure, response=response)
+            response.raise_for_status()
+            return response.json()
+        raise RuntimeError(f"Oura request to {url_slug} failed after retries")
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """Honor Retry-After when present, else back off exponentially."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return min(2 ** (attempt - 1), 30)
 
     def _format_dates(
         self, start_date: str | None, end_date: str | None
@@ -10,11 +10,13 @@ import json
 import os
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-from oura_client import OuraClient
+from oura_client import DEFAULT_REQUESTS_PER_MINUTE, OuraAuthError, OuraClient
 from oura_transforms import combine_daily_dataframes
 
 
@@ -22,7 +24,17 @@ logger = logging.getLogger(__name__)
 
 
 def get_resident_token(resident_no: int, env_files_dir: str) -> str | None:
-    """Get the access token for a specific resident."""
+    """Get the access token for a specific resident.
+
+    Tokens do not change during a run, so each (resident, directory) pair is
+    read once; the directory is resolved so relative and absolute spellings
+    share a cache entry.
+    """
+    return _read_resident_token(resident_no, str(Path(env_files_dir).resolve()))
+
+
+@lru_cache(maxsize=64)
+def _read_resident_token(resident_no: int, env_files_dir: str) -> str | None:
     env_file_at = Path(env_files_dir) / f"pat_r{resident_no}.env"
 
     if not env_file_at.exists():
@@ -31,8 +43,9 @@ def get_resident_token(resident_no: int, env_files_dir: str) -> str | None:
         )
         return None
 
-    load_dotenv(dotenv_path=env_file_at, override=True)
-    token = os.getenv("PERSONAL_ACCESS_TOKEN")
+    # Read the file directly rather than via os.environ: residents may be
+    # processed concurrently, and a shared env var would leak across threads.
+    token = dotenv_values(env_file_at).get("PERSONAL_ACCESS_TOKEN")
 
     if not token:
         logger.warning(f"No access token found for resident {resident_no}")
@@ -41,41 +54,54 @@ def get_resident_token(resident_no: int, env_files_dir: str) -> str | None:
     return token
 
 
-def collect_oura_data(
-    client: OuraClient, params: dict, data_types: dict
-) -> dict[str, Any]:
-    """Collect all specified Oura data types."""
-    data = {}
+# (DATA_TYPES flag, result key, OuraClient method, log label)
+OURA_ENDPOINTS = (
+    ("daily_sleep", "sleep", "get_daily_sleep", "daily sleep"),
+    ("sleep_periods", "sleep_periods", "get_sleep_periods", "sleep periods"),
+    ("daily_activity", "activity", "get_daily_activity", "daily activity"),
+    ("daily_readiness", "readiness", "get_daily_readiness", "daily readiness"),
+    ("heart_rate", "heart_rate", "get_heart_rate", "heart rate"),
+    ("sessions", "sessions", "get_sessions", "sessions"),
+    ("workouts", "workouts", "get_workouts", "workouts"),
+)
 
-    if data_types.get("daily_sleep"):
-        logger.info("  - Fetching daily sleep data...")
-        data["sleep"] = client.get_daily_sleep(**params)
 
-    if data_types.get("sleep_periods"):
-        logger.info("  - Fetching sleep periods data...")
-        data["sleep_periods"] = client.get_sleep_periods(**params)
+def collect_oura_data(
+    client: OuraClient, params: dict, data_types: dict, resident_no: int | None = None
+) -> dict[str, Any]:
+    """Collect all specified Oura data types.
 
-    if data_types.get("daily_activity"):
-        logger.info("  - Fetching daily activity data...")
-        data["activity"] = client.get_daily_activity(**params)
+    The endpoints are independent, so they are fetched concurrently over the
+    client's shared session; results keep the OURA_ENDPOINTS order.
+    """
+    # Tag progress lines so concurrent residents' logs stay attributable.
+    tag = f"[R{resident_no}] " if resident_no is not None else ""
+    enabled = [
+        (key, method, label)
+        for flag, key, method, label in OURA_ENDPOINTS
+        if data_types.get(flag)
+    ]
+    if not enabled:
+        return {}
 
-    if data_types.get("daily_readiness"):
-        logger.info("  - Fetching daily readiness data...")
-        data["readiness"] = client.get_daily_readiness(**params)
+    futures = {}
+    with ThreadPoolExecutor(max_workers=len(enabled)) as pool:
+        for key, method, label in enabled:
+            logger.info(f"  - {tag}Fetching {label} data...")
+            futures[key] = pool.submit(getattr(client, method), **params)
+        return {key: future.result() for key, future in futures.items()}
 
-    if data_types.get("heart_rate"):
-        logger.info("  - Fetching heart rate data...")
-        data["heart_rate"] = client.get_heart_rate(**params)
 
-    if data_types.get("sessions"):
-        logger.info("  - Fetching sessions data...")
-        data["sessions"] = client.get_sessions(**params)
+# Output directories already created in this process. Every resident saves
+# into the same few folders, so only the first save needs the mkdir calls.
+_ensured_dirs: set[Path] = set()
 
-    if data_types.get("workouts"):
-        logger.info("  - Fetching workouts data...")
-        data["workouts"] = client.get_workouts(**params)
 
-    return data
+def _ensure_dir(path: Path) -> None:
+    # A race between workers just repeats an idempotent mkdir.
+    if path not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
 
 
 def save_data(
@@ -93,9 +119,8 @@ def save_data(
     combined_dir = json_base_dir / paths["combined_subdir"]
 
     # Ensure all directories exist
-    separate_dir.mkdir(parents=True, exist_ok=True)
-    combined_dir.mkdir(parents=True, exist_ok=True)
-    csv_dir.mkdir(parents=True, exist_ok=True)
+    for directory in (separate_dir, combined_dir, csv_dir):
+        _ensure_dir(directory)
 
     # Save individual JSON files
     if options.get("save_individual_jsons"):
@@ -135,8 +160,16 @@ def process_resident(
     options: dict,
     data_types: dict,
     oura_bq: dict,
+    bq_batch=None,
 ) -> dict:
-    """Process Oura data for a single resident."""
+    """
+    Process Oura data for a single resident.
+
+    When bq_batch (an oura_bigquery_loader.FrameBatch) is given, the
+    resident's frames are queued on it instead of uploaded immediately, and
+    bq_export reports the rows queued; the caller replaces it with the
+    batch's export_status() once the batch is flushed.
+    """
     logger.info(f"Processing resident {resident_no}...")
 
     try:
@@ -150,15 +183,30 @@ def process_resident(
             }
 
         # Collect data
-        with OuraClient(token) as client:
-            data = collect_oura_data(client, params, data_types)
+        with OuraClient(
+            token,
+            requests_per_minute=options.get(
+                "oura_requests_per_minute", DEFAULT_REQUESTS_PER_MINUTE
+            ),
+            max_retries=options.get("oura_max_retries"),
+        ) as client:
+            data = collect_oura_data(client, params, data_types, resident_no)
 
         # Save data locally
         save_results = save_data(resident_no, data, output_base, paths, options)
 
         # Optionally export to BigQuery
         bq_results = None
-        if options.get("export_to_bigquery"):
+        if bq_batch is not None:
+            try:
+                from oura_bigquery_loader import build_daily_frames
+
+                bq_results = bq_batch.add(build_daily_frames(data, resident_no), resident_no)
+            except Exception:
+                logger.error(
+                    f"BigQuery export failed for resident {resident_no}", exc_info=True
+                )
+        elif options.get("export_to_bigquery"):
             try:
                 from oura_bigquery_loader import export_daily_to_bigquery
 
@@ -191,18 +239,81 @@ def process_resident(
             "bq_export": bq_results,
         }
 
+    except OuraAuthError as e:
+        # Expected when a PAT is revoked or expired; no traceback needed.
+        logger.error(f"❌ Resident {resident_no}: {e}")
+        return {"resident": resident_no, "status": "error", "message": str(e)}
     except Exception as e:
         logger.error(f"❌ Error processing resident {resident_no}: {e}", exc_info=True)
         return {"resident": resident_no, "status": "error", "message": str(e)}
 
 
+def _previous_results(output_base: Path, params: dict, options: dict) -> list:
+    """Per-resident results of a previous run over the same dates, if any.
+
+    Read from the batch_processing_summary.json written by create_summary_report.
+    With BigQuery export enabled, a run in the other dry-run mode does not count.
+    """
+    try:
+        with open(output_base / "batch_processing_summary.json") as f:
+            summary = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if summary.get("date_range") != params:
+        return []
+
+    prev_options = summary.get("configuration", {}).get("options", {})
+    if options.get("export_to_bigquery") and prev_options.get(
+        "bq_dry_run", True
+    ) != options.get("bq_dry_run", True):
+        return []
+    return summary.get("detailed_results", [])
+
+
+def completed_residents(output_base: Path, params: dict, options: dict) -> dict:
+    """
+    Results of residents a previous run over the same dates already finished.
+
+    When BigQuery export is enabled, a resident only counts as done if all of
+    its tables were exported in the same dry-run mode, so a resumed run never
+    appends duplicates but still uploads what was missed.
+    """
+    require_bq = bool(options.get("export_to_bigquery"))
+    done = {}
+    for result in _previous_results(output_base, params, options):
+        if result.get("status") != "success":
+            continue
+        if require_bq and (not result.get("bq_export") or result.get("bq_export_failed")):
+            continue
+        done[result["resident"]] = result
+    return done
+
+
+def exported_tables(output_base: Path, params: dict, options: dict) -> dict:
+    """
+    BigQuery tables a previous run over the same dates already loaded.
+
+    Maps resident -> {table_name: rows}, for seeding FrameBatch(already_loaded=)
+    so a resumed resident re-exports only the tables that failed.
+    """
+    if not options.get("export_to_bigquery"):
+        return {}
+    return {
+        result["resident"]: dict(result["bq_export"])
+        for result in _previous_results(output_base, params, options)
+        if result.get("status") == "success" and result.get("bq_export")
+    }
+
+
 def create_summary_report(results: list, output_base: Path, params: dict, config: dict):
     """Create a comprehensive summary report."""
     if not config["options"].get("create_summary_report"):
         return
 
+    # One timestamp for both files, so the JSON and status text agree.
+    generated_at = datetime.datetime.now()
     summary = {
-        "processing_timestamp": datetime.datetime.now().isoformat(),
+        "processing_timestamp": generated_at.isoformat(),
         "date_range": params,
         "configuration": {
             "residents_requested": config["residents"],
@@ -232,7 +343,7 @@ def create_summary_report(results: list, output_base: Path, params: dict, config
     status_file = output_base / "processing_status.txt"
     with open(status_file, "w") as f:
         f.write("Oura Ring Batch Processing Status\n")
-        f.write(f"Generated: {datetime.datetime.now()}\n\n")
+        f.write(f"Generated: {generated_at}\n\n")
         f.write(f"Total residents: {summary['summary_stats']['total_residents']}\n")
         f.write(f"Successful: {summary['summary_stats']['successful']}\n")
         f.write(f"Failed: {summary['summary_stats']['failed']}\n")
@@ -43,6 +43,8 @@ OPTIONS = {
     # BigQuery export settings (safe defaults)
     "export_to_bigquery": False,  # If True, will attempt to export daily data to BigQuery
     "bq_dry_run": True,  # When True, validates upload path without network calls
+    "oura_requests_per_minute": 300,  # Per-token Oura API request budget (0 disables)
+    "oura_max_retries": 5,  # Attempts per Oura request when throttled (429/502/503)
 }
 
 # Data types to collect (set to False to skip)
@@ -104,12 +104,7 @@ def resolve_scripts(sql_dir: Path, names: List[str]) -> List[Path]:
 
 def date_range(start: date, end: date) -> List[date]:
     """Return inclusive list of dates from start to end."""
-    days = []
-    current = start
-    while current <= end:
-        days.append(current)
-        current += timedelta(days=1)
-    return days
+    return [date.fromordinal(o) for o in range(start.toordinal(), end.toordinal() + 1)]
 
 
 def execute_sql(
@@ -110,6 +110,45 @@ def parse_args() -> argparse.Namespace:
     return args
 
 
+def _parse_ymd(value: str) -> datetime:
+    """Parse YYYY-MM-DD exactly as strptime("%Y-%m-%d") does, faster.
+
+    The zero-padded form goes through the C fromisoformat; anything else
+    (e.g. unpadded 2025-6-1) still goes through strptime, so times, compact
+    and week-date forms that fromisoformat would accept stay rejected.
+    """
+    if (
+        len(value) == 10
+        and value[4] == value[7] == "-"
+        and value.isascii()
+        and (value[:4] + value[5:7] + value[8:]).isdigit()
+    ):
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def _ts_window(column: str) -> str:
+    """SQL predicate keeping ``column`` inside the inclusive @start_date..@end_date window.
+
+    Comparing the raw TIMESTAMP against parameter bounds (instead of wrapping it
+    in DATE() and matching string literals) keeps partition pruning reliable.
+    """
+    return (
+        f"{column} >= TIMESTAMP(@start_date) "
+        f"AND {column} < TIMESTAMP(DATE_ADD(@end_date, INTERVAL 1 DAY))"
+    )
+
+
+def _date_range_job_config(start_date: str, end_date: str) -> bigquery.QueryJobConfig:
+    """Query config binding the DATE parameters used by _ts_window."""
+    return bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter('start_date', 'DATE', start_date),
+            bigquery.ScalarQueryParameter('end_date', 'DATE', end_date),
+        ]
+    )
+
+
 def calculate_date_range(args: argparse.Namespace) -> Tuple[str, str]:
     """Calculate start and end dates based on arguments."""
     if args.days:
@@ -152,13 +191,15 @@ def check_raw_table_schema(
         DATE({date_col}) as date,
         COUNT(*) as row_count
     FROM `{dataset}.{table_name}`
-    WHERE DATE({date_col}) BETWEEN '{start_date}' AND '{end_date}'
+    WHERE {_ts_window(date_col)}
     GROUP BY date
     ORDER BY date
     """
     
     try:
-        df = client.query(query).to_dataframe()
+        df = client.query(
+            query, job_config=_date_range_job_config(start_date, end_date)
+        ).to_dataframe()
         
         if df.empty:
             issues.append(f"No raw {source} data found for date range")
@@ -166,8 +207,8 @@ def check_raw_table_schema(
         
         # Check for expected days
         expected_days = (
-            datetime.strptime(end_date, '%Y-%m-%d').date() -
-            datetime.strptime(start_date, '%Y-%m-%d').date()
+            _parse_ymd(end_date).date() -
+            _parse_ymd(start_date).date()
         ).days + 1
         
         actual_days = len(df)
@@ -258,14 +299,16 @@ def check_coverage(
         COUNTIF(l.value IS NULL) as null_count,
         COUNTIF(l.value IS NOT NULL) as valid_count
     FROM `{dataset}.sensor_readings_long` l
-    WHERE DATE(l.timestamp) BETWEEN '{start_date}' AND '{end_date}'
+    WHERE {_ts_window('l.timestamp')}
       {metric_filter}
     GROUP BY date, metric
     ORDER BY date, metric
     """
     
     try:
-        df = client.query(query).to_dataframe()
+        df = client.query(
+            query, job_config=_date_range_job_config(start_date, end_date)
+        ).to_dataframe()
         
         if df.empty:
             issues.append(f"No transformed data found for {source} in date range")
@@ -289,8 +332,8 @@ def check_coverage(
         
         # Check for missing days
         expected_days = (
-            datetime.strptime(end_date, '%Y-%m-%d').date() -
-            datetime.strptime(start_date, '%Y-%m-%d').date()
+            _parse_ymd(end_date).date() -
+            _parse_ymd(start_date).date()
         ).days + 1
         
         actual_days = df['date'].nunique()
@@ -345,13 +388,15 @@ def check_raw_tsi_metrics(
         ROUND(100.0 * COUNTIF(temperature IS NULL) / COUNT(*), 2) as null_temp_pct,
         ROUND(100.0 * COUNTIF(humidity IS NULL) / COUNT(*), 2) as null_humidity_pct
     FROM `{dataset}.tsi_raw_materialized`
-    WHERE DATE(ts) BETWEEN '{start_date}' AND '{end_date}'
+    WHERE {_ts_window('ts')}
     GROUP BY date
     ORDER BY date DESC
     """
     
     try:
-        df = client.query(query).to_dataframe()
+        df = client.query(
+            query, job_config=_date_range_job_config(start_date, end_date)
+        ).to_dataframe()
         
         if df.empty:
             issues.append("No TSI raw data found in date range")
@@ -463,7 +508,7 @@ def check_aggregate_consistency(
                 TIMESTAMP_TRUNC(l.timestamp, HOUR)
             ))) as expected_hourly_count
         FROM `{dataset}.sensor_readings_long` l
-        WHERE DATE(l.timestamp) BETWEEN '{start_date}' AND '{end_date}'
+        WHERE {_ts_window('l.timestamp')}
           {metric_filter}
         GROUP BY date
     ),
@@ -472,7 +517,7 @@ def check_aggregate_consistency(
             DATE(h.hour_ts) as date,
             COUNT(*) as hourly_count
         FROM `{dataset}.sensor_readings_hourly` h
-        WHERE DATE(h.hour_ts) BETWEEN '{start_date}' AND '{end_date}'
+        WHERE {_ts_window('h.hour_ts')}
           AND ({metric_filter.replace('l.metric_name', 'h.metric_name').replace('AND ', '')})
         GROUP BY date
     )
@@ -487,7 +532,9 @@ def check_aggregate_consistency(
     """
     
     try:
-        df = client.query(query).to_dataframe()
+        df = client.query(
+            query, job_config=_date_range_job_config(start_date, end_date)
+        ).to_dataframe()
         
         if df.empty:
             issues.append(f"No aggregate data found for {source} in date range")
@@ -207,15 +207,20 @@ def print_daily_scale_stats(rows: List[Dict[str, Any]]) -> None:
     if not rows:
         print("\nDaily scale scan: no non-null temperature rows.")
         return
-    print("\nDaily scale scan")
-    print("----------------")
-    print("day         p50    c_ratio  likely_celsius")
+    # One write for the whole table; long backfill ranges produce a row per day.
+    lines = [
+        "",
+        "Daily scale scan",
+        "----------------",
+        "day         p50    c_ratio  likely_celsius",
+    ]
     for r in rows:
         day = str(r.get("day"))
         p50 = float(r.get("p50") or 0.0)
         c_ratio = float(r.get("celsius_ratio") or 0.0)
-        likely = bool(r.get("likely_celsius_day"))
-        print(f"{day}  {p50:6.2f}  {c_ratio:7.3f}  {str(likely).lower()}")
+        likely = "true" if r.get("likely_celsius_day") else "false"
+        lines.append(f"{day}  {p50:6.2f}  {c_ratio:7.3f}  {likely}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def convert_temperature(
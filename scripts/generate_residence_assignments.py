@@ -8,14 +8,47 @@ substitutes `dummy_sensor_id` placeholders.
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import heapq
+import json
+import mmap
 import os
 import re
 import sys
 from pathlib import Path
 
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 
+MAPPING_VIEW = "sensor_serial_to_native"
+
+# One row per (serial, native id) pair. Only GROUP BY + COUNT, so BigQuery can
+# refresh the view incrementally as tsi_raw_materialized grows.
+MAPPING_VIEW_DDL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS `{project}.{raw_dataset}.sensor_serial_to_native` AS
+SELECT
+  TRIM(serial) AS sensor_name,
+  native_sensor_id,
+  COUNT(*) AS row_count
+FROM `{project}.{raw_dataset}.tsi_raw_materialized`
+WHERE serial IS NOT NULL
+  AND TRIM(serial) != ''
+  AND native_sensor_id IS NOT NULL
+  AND TRIM(native_sensor_id) != ''
+GROUP BY sensor_name, native_sensor_id
+"""
+
 MAPPING_SQL = """
+SELECT
+  sensor_name,
+  ARRAY_AGG(native_sensor_id ORDER BY native_sensor_id) AS native_sensor_ids
+FROM `{project}.{raw_dataset}.sensor_serial_to_native`
+GROUP BY sensor_name
+"""
+
+# Used until the materialized view has been created with --create-mapping-view.
+BASE_MAPPING_SQL = """
 SELECT
   TRIM(serial) AS sensor_name,
   ARRAY_AGG(DISTINCT native_sensor_id ORDER BY native_sensor_id) AS native_sensor_ids
@@ -27,26 +60,61 @@ WHERE serial IS NOT NULL
 GROUP BY sensor_name
 """
 
+MAPPING_CACHE_DIR = Path.home() / ".cache" / "durham-env"
+
 ASSIGNMENT_LINE_RE = re.compile(
     r"^\s*\(\s*'[^']+'\s*,\s*'(?P<dummy_id>dummy_sensor_id[^']*)'\s*,\s*'(?P<sensor_name>[^']+)'\s*,"
 )
 
+# Byte-mode equivalent of ASSIGNMENT_LINE_RE for memory-mapped templates. It runs
+# over the whole buffer in MULTILINE mode, so whitespace must not cross newlines.
+ASSIGNMENT_LINE_BYTES_RE = re.compile(
+    rb"^[^\S\n]*\([^\S\n]*'[^'\n]+'[^\S\n]*,[^\S\n]*'(?P<dummy_id>dummy_sensor_id[^'\n]*)'"
+    rb"[^\S\n]*,[^\S\n]*'(?P<sensor_name>[^'\n]+)'[^\S\n]*,",
+    re.MULTILINE,
+)
+
+# Local templates above this size are memory-mapped instead of read into a str.
+LARGE_TEMPLATE_BYTES = 1_048_576
+
 
 def fetch_sensor_mapping(
     client: bigquery.Client,
     project: str,
     raw_dataset: str,
+    location: str | None = None,
 ) -> tuple[dict[str, str], dict[str, list[str]]]:
     """Return serial->native map and ambiguous serials with multiple native ids."""
-    dataset = client.get_dataset(f"{project}.{raw_dataset}")
-    query = MAPPING_SQL.format(project=project, raw_dataset=raw_dataset)
-    job = client.query(query, location=dataset.location)
+    # Same query text on each run, so same-day reruns are served from the BQ result cache.
+    job_config = bigquery.QueryJobConfig(
+        use_query_cache=True,
+        labels={"tool": "generate_residence_assignments"},
+    )
+    try:
+        query = MAPPING_SQL.format(project=project, raw_dataset=raw_dataset)
+        job = client.query(query, job_config=job_config, location=location)
+        result = job.result()
+    except NotFound:
+        print(
+            f"[WARN] {project}.{raw_dataset}.{MAPPING_VIEW} not found; scanning "
+            "tsi_raw_materialized instead (run with --create-mapping-view once).",
+            file=sys.stderr,
+        )
+        query = BASE_MAPPING_SQL.format(project=project, raw_dataset=raw_dataset)
+        job = client.query(query, job_config=job_config, location=location)
+        result = job.result()
+
+    # Arrow over the BigQuery Storage Read API avoids per-row JSON decoding.
+    table = result.to_arrow(create_bqstorage_client=True)
 
     mapping: dict[str, str] = {}
     ambiguous: dict[str, list[str]] = {}
-    for row in job.result():
-        sensor_name = str(row["sensor_name"])
-        native_sensor_ids = [str(v) for v in row["native_sensor_ids"] if v]
+    for name, ids in zip(
+        table.column("sensor_name").to_pylist(),
+        table.column("native_sensor_ids").to_pylist(),
+    ):
+        sensor_name = str(name)
+        native_sensor_ids = [str(v) for v in ids or [] if v]
         if len(native_sensor_ids) == 1:
             mapping[sensor_name] = native_sensor_ids[0]
         elif len(native_sensor_ids) > 1:
@@ -54,6 +122,63 @@ def fetch_sensor_mapping(
     return mapping, ambiguous
 
 
+def create_mapping_view(
+    client: bigquery.Client,
+    project: str,
+    raw_dataset: str,
+    location: str | None = None,
+) -> None:
+    """Create the sensor_serial_to_native materialized view if it does not exist."""
+    ddl = MAPPING_VIEW_DDL.format(project=project, raw_dataset=raw_dataset)
+    client.query(ddl, location=location).result()
+    print(f"Ensured materialized view {project}.{raw_dataset}.{MAPPING_VIEW}", file=sys.stderr)
+
+
+def mapping_cache_path(project: str, raw_dataset: str) -> Path:
+    return MAPPING_CACHE_DIR / f"sensor_mapping_{project}_{raw_dataset}.json"
+
+
+def fetch_sensor_mapping_cached(
+    client: bigquery.Client,
+    project: str,
+    raw_dataset: str,
+    location: str | None = None,
+    *,
+    refresh: bool = False,
+) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """Return the sensor mapping, reusing a local cache while the source table is unchanged.
+
+    The cache is keyed on the `modified` timestamp of tsi_raw_materialized, which
+    is a cheap metadata lookup compared to running MAPPING_SQL.
+    """
+    table = client.get_table(f"{project}.{raw_dataset}.tsi_raw_materialized")
+    modified = table.modified.isoformat() if table.modified else None
+    cache_path = mapping_cache_path(project, raw_dataset)
+
+    if not refresh and modified and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+        if cached.get("modified") == modified:
+            print(f"Using cached sensor mapping: {cache_path}", file=sys.stderr)
+            return cached["mapping"], cached["ambiguous"]
+
+    mapping, ambiguous = fetch_sensor_mapping(client, project, raw_dataset, location)
+    if modified:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps(
+                    {"modified": modified, "mapping": mapping, "ambiguous": ambiguous}
+                ),
+                encoding="utf-8",
+            )
+        except OSError as exc:
+            print(f"[WARN] Could not write mapping cache {cache_path}: {exc}", file=sys.stderr)
+    return mapping, ambiguous
+
+
 def substitute_template(
     template_sql: str,
     mapping: dict[str, str],
@@ -61,44 +186,121 @@ def substitute_template(
     """Replace dummy_sensor_id by sensor_name lookup; return sql, missing names, count."""
     missing: set[str] = set()
     replaced = 0
-    output_lines: list[str] = []
+    # Unmatched lines pass through unchanged, so rewrite the split list in place
+    # rather than appending every line to a second, growing list.
+    output_lines = template_sql.splitlines(keepends=True)
+
+    for i, line in enumerate(output_lines):
+        # Cheap literal check first: most template lines (comments, DDL, blanks)
+        # can never match, so skip the regex for them.
+        if "'dummy_sensor_id" not in line:
+            continue
 
-    for line in template_sql.splitlines(keepends=True):
         match = ASSIGNMENT_LINE_RE.match(line)
         if not match:
-            output_lines.append(line)
             continue
 
         sensor_name = match.group("sensor_name")
+        if sensor_name in missing:
+            continue
+
         dummy_id = match.group("dummy_id")
         native_sensor_id = mapping.get(sensor_name)
         if native_sensor_id is None:
             missing.add(sensor_name)
-            output_lines.append(line)
             continue
 
-        output_lines.append(line.replace(f"'{dummy_id}'", f"'{native_sensor_id}'", 1))
+        output_lines[i] = line.replace(f"'{dummy_id}'", f"'{native_sensor_id}'", 1)
         replaced += 1
 
     return "".join(output_lines), missing, replaced
 
 
-def print_mapping_issues(missing: set[str], ambiguous: dict[str, list[str]]) -> None:
+def substitute_template_bytes(
+    template_buf: bytes | mmap.mmap,
+    mapping: dict[str, str],
+) -> tuple[bytes, set[str], int]:
+    """Byte-mode substitute_template for large, memory-mapped templates."""
+    missing: set[str] = set()
+    replaced = 0
+    chunks: list[bytes] = []
+    pos = 0
+
+    for match in ASSIGNMENT_LINE_BYTES_RE.finditer(template_buf):
+        sensor_name = match.group("sensor_name").decode("utf-8")
+        if sensor_name in missing:
+            continue
+        native_sensor_id = mapping.get(sensor_name)
+        if native_sensor_id is None:
+            missing.add(sensor_name)
+            continue
+
+        chunks.append(template_buf[pos : match.start("dummy_id")])
+        chunks.append(native_sensor_id.encode("utf-8"))
+        pos = match.end("dummy_id")
+        replaced += 1
+
+    chunks.append(template_buf[pos:])
+    return b"".join(chunks), missing, replaced
+
+
+def print_mapping_issues(
+    missing: set[str],
+    ambiguous: dict[str, list[str]],
+    max_issues: int = 50,
+) -> None:
+    """Print the first max_issues ambiguous/missing sensor names in sorted order."""
     if ambiguous:
         print(
             "[ERROR] Ambiguous serial mapping (multiple native_sensor_id values):",
             file=sys.stderr,
         )
-        for sensor_name in sorted(ambiguous):
+        for sensor_name in heapq.nsmallest(max_issues, ambiguous):
             choices = ", ".join(ambiguous[sensor_name])
             print(f"  - {sensor_name}: {choices}", file=sys.stderr)
+        if len(ambiguous) > max_issues:
+            print(f"  (+{len(ambiguous) - max_issues} more)", file=sys.stderr)
     if missing:
         print(
             "[ERROR] Missing native_sensor_id mapping for template sensor_name values:",
             file=sys.stderr,
         )
-        for sensor_name in sorted(missing):
+        for sensor_name in heapq.nsmallest(max_issues, missing):
             print(f"  - {sensor_name}", file=sys.stderr)
+        if len(missing) > max_issues:
+            print(f"  (+{len(missing) - max_issues} more)", file=sys.stderr)
+
+
+@functools.lru_cache(maxsize=1)
+def _secret_manager_client():
+    """Return a shared Secret Manager client (construction opens a gRPC channel)."""
+    try:
+        from google.cloud import secretmanager
+    except ImportError as exc:
+        raise SystemExit(
+            "google-cloud-secret-manager is required when using "
+            "--template-secret-id"
+        ) from exc
+    return secretmanager.SecretManagerServiceClient()
+
+
+def large_local_template(
+    *,
+    template: str,
+    private_template: str,
+    template_secret_id: str | None,
+) -> Path | None:
+    """Return the local template load_template_sql would read if it is large enough to mmap."""
+    private_template_path = Path(private_template)
+    if private_template_path.exists():
+        candidate = private_template_path
+    elif template_secret_id:
+        return None
+    else:
+        candidate = Path(template)
+    if candidate.is_file() and candidate.stat().st_size > LARGE_TEMPLATE_BYTES:
+        return candidate
+    return None
 
 
 def load_template_sql(
@@ -114,14 +316,6 @@ def load_template_sql(
         return private_template_path.read_text(encoding="utf-8"), str(private_template_path), True
 
     if template_secret_id:
-        try:
-            from google.cloud import secretmanager
-        except ImportError as exc:
-            raise SystemExit(
-                "google-cloud-secret-manager is required when using "
-                "--template-secret-id"
-            ) from exc
-        sm_client = secretmanager.SecretManagerServiceClient()
         if template_secret_id.startswith("projects/"):
             if "/versions/" in template_secret_id:
                 secret_version_name = template_secret_id
@@ -134,13 +328,23 @@ def load_template_sql(
                 f"projects/{project}/secrets/{template_secret_id}/versions/"
                 f"{template_secret_version}"
             )
-        payload = sm_client.access_secret_version(name=secret_version_name).payload
+        payload = _secret_manager_client().access_secret_version(
+            name=secret_version_name
+        ).payload
         return payload.data.decode("utf-8"), secret_version_name, True
 
     template_path = Path(template)
     return template_path.read_text(encoding="utf-8"), str(template_path), False
 
 
+def _non_negative_int(value: str) -> int:
+    """argparse type for counts where 0 is allowed but negatives are not."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate residence sensor assignment SQL from BigQuery serial mapping.",
@@ -151,6 +355,11 @@ def main() -> None:
         required=True,
         help="Dataset containing tsi_raw_materialized (e.g., sensors)",
     )
+    parser.add_argument(
+        "--location",
+        default=os.getenv("BQ_LOCATION", "US"),
+        help="BigQuery location for the mapping query (default: BQ_LOCATION or US)",
+    )
     parser.add_argument(
         "--template",
         default="transformations/sql/07_residence_sensor_assignments.template.sql",
@@ -187,33 +396,89 @@ def main() -> None:
         action="store_true",
         help="Write output file; otherwise print SQL to stdout",
     )
+    parser.add_argument(
+        "--max-issues",
+        type=_non_negative_int,
+        default=50,
+        help="Maximum missing/ambiguous sensor names to print per category (default: 50)",
+    )
+    parser.add_argument(
+        "--create-mapping-view",
+        action="store_true",
+        help=(
+            f"Create the {MAPPING_VIEW} materialized view in --raw-dataset "
+            "before looking up the mapping (one-time setup)"
+        ),
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query BigQuery for the sensor mapping and skip the local cache",
+    )
+    cache_group.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Query BigQuery for the sensor mapping and overwrite the local cache",
+    )
     args = parser.parse_args()
 
     output_path = Path(args.output)
-    template_sql, template_source, has_private_source = load_template_sql(
-        project=args.project,
+    large_template = large_local_template(
         template=args.template,
         private_template=args.private_template,
         template_secret_id=args.template_secret_id,
-        template_secret_version=args.template_secret_version,
     )
-    print(f"Using assignment template source: {template_source}", file=sys.stderr)
-    if "'dummy_sensor_id'" in template_sql:
-        client = bigquery.Client(project=args.project)
-        mapping, ambiguous = fetch_sensor_mapping(client, args.project, args.raw_dataset)
-        rendered_sql, missing, replaced = substitute_template(template_sql, mapping)
-        print(f"Resolved {replaced} sensor assignments from BigQuery mapping.", file=sys.stderr)
-    else:
-        rendered_sql = template_sql
-        missing = set()
-        ambiguous: dict[str, list[str]] = {}
-        print(
-            "No dummy_sensor_id placeholders found; using template as-is.",
-            file=sys.stderr,
-        )
+    with contextlib.ExitStack() as stack:
+        if large_template is not None:
+            template_file = stack.enter_context(large_template.open("rb"))
+            template_sql = stack.enter_context(
+                mmap.mmap(template_file.fileno(), 0, access=mmap.ACCESS_READ)
+            )
+            template_source = f"{large_template} (memory-mapped)"
+            has_private_source = large_template == Path(args.private_template)
+            has_placeholders = template_sql.find(b"'dummy_sensor_id'") != -1
+            substitute = substitute_template_bytes
+        else:
+            template_sql, template_source, has_private_source = load_template_sql(
+                project=args.project,
+                template=args.template,
+                private_template=args.private_template,
+                template_secret_id=args.template_secret_id,
+                template_secret_version=args.template_secret_version,
+            )
+            has_placeholders = "'dummy_sensor_id'" in template_sql
+            substitute = substitute_template
+        print(f"Using assignment template source: {template_source}", file=sys.stderr)
+        if has_placeholders:
+            client = bigquery.Client(project=args.project)
+            if args.create_mapping_view:
+                create_mapping_view(client, args.project, args.raw_dataset, args.location)
+            if args.no_cache:
+                mapping, ambiguous = fetch_sensor_mapping(
+                    client, args.project, args.raw_dataset, args.location
+                )
+            else:
+                mapping, ambiguous = fetch_sensor_mapping_cached(
+                    client,
+                    args.project,
+                    args.raw_dataset,
+                    args.location,
+                    refresh=args.refresh_cache,
+                )
+            rendered_sql, missing, replaced = substitute(template_sql, mapping)
+            print(f"Resolved {replaced} sensor assignments from BigQuery mapping.", file=sys.stderr)
+        else:
+            rendered_sql = template_sql[:]
+            missing = set()
+            ambiguous: dict[str, list[str]] = {}
+            print(
+                "No dummy_sensor_id placeholders found; using template as-is.",
+                file=sys.stderr,
+            )
 
     if missing or ambiguous:
-        print_mapping_issues(missing, ambiguous)
+        print_mapping_issues(missing, ambiguous, args.max_issues)
         if not has_private_source:
             print(
                 "[ERROR] No private assignment template source found. Provide either "
@@ -228,11 +493,18 @@ def main() -> None:
 
     if args.execute:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(rendered_sql, encoding="utf-8")
+        if isinstance(rendered_sql, bytes):
+            output_path.write_bytes(rendered_sql)
+        else:
+            output_path.write_text(rendered_sql, encoding="utf-8")
         print(f"Wrote generated SQL to {output_path}", file=sys.stderr)
         return
 
-    print(rendered_sql, end="")
+    if isinstance(rendered_sql, bytes):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(rendered_sql)
+    else:
+        print(rendered_sql, end="")
 
 
 if __name__ == "__main__":
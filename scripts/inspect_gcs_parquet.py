@@ -68,7 +68,7 @@ def inspect_parquet(uri: str, sample_numeric_limit: int = 40) -> Dict[str, Any]:
     summary["row_count"] = len(df)
     summary["columns"] = list(df.columns)
     summary["dtypes"] = {c: str(t) for c, t in df.dtypes.items()}
-    summary["non_null_counts"] = {c: int(df[c].notna().sum()) for c in df.columns}
+    summary["non_null_counts"] = {c: int(n) for c, n in df.notna().sum().items()}
 
     numeric_cols = df.select_dtypes(include="number").columns.tolist()[:sample_numeric_limit]
     stats: Dict[str, Dict[str, float]] = {}
@@ -86,11 +86,14 @@ def inspect_parquet(uri: str, sample_numeric_limit: int = 40) -> Dict[str, Any]:
     ts_preview: Dict[str, Any] = {}
     for c in ts_cols:
         try:
-            s = pd.to_datetime(df[c], errors="coerce")
-            s = s.dropna()
-            if s.empty:
+            s = df[c]
+            # Parquet timestamps arrive typed; only parse when the column is not.
+            if not pd.api.types.is_datetime64_any_dtype(s):
+                s = pd.to_datetime(s, errors="coerce")
+            lo, hi = s.min(), s.max()
+            if pd.isna(lo):
                 continue
-            ts_preview[c] = {"min": s.min().isoformat(), "max": s.max().isoformat()}
+            ts_preview[c] = {"min": lo.isoformat(), "max": hi.isoformat()}
         except Exception:
             pass
     summary["timestamp_preview"] = ts_preview
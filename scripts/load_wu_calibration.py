@@ -3,7 +3,6 @@
 
 import os
 
-import pandas as pd
 from google.cloud import bigquery
 
 PROJECT = os.environ.get("GCP_PROJECT_ID", "durham-weather-466502")
@@ -124,7 +123,8 @@ wu_calibration = {
     ],
 }
 
-df = pd.DataFrame(wu_calibration)
+# One JSON row per station; avoids a DataFrame -> Parquet round-trip for 14 rows
+rows = [dict(zip(wu_calibration, values)) for values in zip(*wu_calibration.values())]
 
 client = bigquery.Client(project=PROJECT)
 
@@ -142,10 +142,15 @@ schema = [
 table_id = f"{PROJECT}.sensors.wu_calibration_config"
 
 # Truncate and load
-job_config = bigquery.LoadJobConfig(schema=schema, write_disposition="WRITE_TRUNCATE")
-job = client.load_table_from_dataframe(df, table_id, job_config=job_config)
+job_config = bigquery.LoadJobConfig(
+    schema=schema,
+    write_disposition="WRITE_TRUNCATE",
+    source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+)
+job = client.load_table_from_json(rows, table_id, job_config=job_config)
 job.result()
 
-print(f"✅ Loaded {len(df)} WU calibration records to {table_id}")
+print(f"✅ Loaded {len(rows)} WU calibration records to {table_id}")
 print("\nSample:")
-print(df.head(3))
+for row in rows[:3]:
+    print(row)
@@ -283,7 +283,7 @@ def insert_partition_from_external(client: bigquery.Client, dataset: str, table:
     SELECT {', '.join(select_list)}
     FROM `{external_table_ref}` AS t
     WHERE DATE({ts_expr}) = @d
-      AND REGEXP_CONTAINS(_FILE_NAME, @dtpath)
+      AND STRPOS(_FILE_NAME, @dtpath) > 0
     """
     job = client.query(sql, job_config=bigquery.QueryJobConfig(
         query_parameters=[
@@ -28,9 +28,9 @@ import argparse
 import logging
 import os
 import sys
-from datetime import date, timedelta
+from datetime import date
 from pathlib import Path
-from typing import List
+from typing import Iterator
 
 log = logging.getLogger(__name__)
 
@@ -85,13 +85,9 @@ SELECT COUNT(*) AS row_count FROM `{project}.{dataset}.{staging_table}`
 # ---------------------------------------------------------------------------
 
 
-def date_range(start: date, end: date) -> List[date]:
-    days = []
-    current = start
-    while current <= end:
-        days.append(current)
-        current += timedelta(days=1)
-    return days
+def date_range(start: date, end: date) -> Iterator[date]:
+    """Lazily iterate each date from start to end inclusive."""
+    return map(date.fromordinal, range(start.toordinal(), end.toordinal() + 1))
 
 
 def staging_table_name(d: date) -> str:
@@ -204,7 +200,7 @@ def main():
 
     start = date.fromisoformat(args.start)
     end = date.fromisoformat(args.end)
-    days = date_range(start, end)
+    total_days = max((end - start).days + 1, 0)
 
     sql_dir = Path(__file__).parent.parent / "transformations" / "sql"
 
@@ -217,7 +213,7 @@ def main():
         dataset,
         start,
         end,
-        len(days),
+        total_days,
     )
 
     try:
@@ -231,7 +227,7 @@ def main():
     total_inserted = 0
     skipped = 0
 
-    for d in days:
+    for d in date_range(start, end):
         proc_date = d.isoformat()
         tbl = staging_table_name(d)
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from google.cloud import bigquery
@@ -65,6 +66,9 @@ def main() -> None:
     parser.add_argument("--bucket", default=os.getenv("GCS_BUCKET", "sensor-data-to-bigquery"))
     parser.add_argument("--prefix", default=os.getenv("GCS_PREFIX", "raw"))
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Days published concurrently (default 4)"
+    )
     args = parser.parse_args()
 
     start = dt.date.fromisoformat(args.start)
@@ -72,14 +76,16 @@ def main() -> None:
     client = bigquery.Client(project=args.project)
     uploader = GCSUploader(bucket=args.bucket, prefix=args.prefix.strip("/"))
 
-    for day in daterange(start, end):
+    def publish_day(day: dt.date) -> list[str]:
+        lines = []
         wide = fetch_wide(client, args.project, args.dataset, day)
         if wide.empty:
-            print(f"[{day}] no AA rows in staging — skip")
-            continue
-        print(f"[{day}] wide rows={len(wide)} sensors={wide['native_sensor_id'].nunique()}")
+            return [f"[{day}] no AA rows in staging — skip"]
+        lines.append(
+            f"[{day}] wide rows={len(wide)} sensors={wide['native_sensor_id'].nunique()}"
+        )
         if args.dry_run:
-            continue
+            return lines
         wide = wide.copy()
         wide["timestamp"] = pd.to_datetime(wide["timestamp"], unit="s", utc=True)
         path = uploader.upload_parquet(
@@ -90,7 +96,15 @@ def main() -> None:
             ts_column="timestamp",
             force=True,
         )
-        print(f"[{day}] uploaded gs://{args.bucket}/{path}")
+        lines.append(f"[{day}] uploaded gs://{args.bucket}/{path}")
+        return lines
+
+    # Days are independent (own staging table, own blob) and each one is a
+    # query round trip plus an upload, so overlap them; map() keeps output in
+    # day order.
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        for lines in pool.map(publish_day, daterange(start, end)):
+            print("\n".join(lines))
 
 
 if __name__ == "__main__":
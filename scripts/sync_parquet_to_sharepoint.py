@@ -29,17 +29,24 @@ Environment Variables:
 """
 
 import argparse
+import io
 import json
 import logging
 import os
+import random
+import re
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, BinaryIO, List, Optional
 
 import requests
 from google.cloud import storage
+from requests.adapters import HTTPAdapter
 
 logging.basicConfig(
     level=logging.INFO,
@@ -48,6 +55,43 @@ logging.basicConfig(
 )
 log = logging.getLogger(__name__)
 
+# Concurrent download+upload transfers per date; each file is network-bound.
+DEFAULT_SYNC_WORKERS = 8
+
+# Graph request budget shared by all transfer threads; keeps bursts of
+# concurrent uploads under SharePoint's throttling limits.
+DEFAULT_GRAPH_REQUESTS_PER_SECOND = 20.0
+
+DT_PARTITION_RE = re.compile(r"/dt=(\d{4}-\d{2}-\d{2})/")
+
+
+class _RateLimiter:
+    """Thread-safe token bucket: at most ``rate`` requests/second after a burst."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until this caller's request slot comes up."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve a token even if it pushes the bucket negative; the
+            # deficit is how long this caller waits for its turn.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
 
 class SharePointUploader:
     """Upload files to SharePoint using Microsoft Graph API."""
@@ -56,7 +100,9 @@ class SharePointUploader:
     REQUEST_TIMEOUT_SECONDS = 30
     MAX_RETRIES = 5
     SIMPLE_UPLOAD_MAX_BYTES = 4 * 1024 * 1024
-    CHUNK_UPLOAD_SIZE_BYTES = 5 * 1024 * 1024
+    # Graph requires upload-session chunks in multiples of 320 KiB and accepts
+    # them only in order, so larger chunks mean fewer sequential round trips.
+    CHUNK_UPLOAD_SIZE_BYTES = 32 * 320 * 1024
 
     def __init__(
         self,
@@ -64,6 +110,8 @@ class SharePointUploader:
         site_id: str,
         drive_id: str,
         base_folder: str = "/Data - Environmental/Google Cloud Sensor Data",
+        pool_size: int = DEFAULT_SYNC_WORKERS,
+        max_requests_per_second: float = DEFAULT_GRAPH_REQUESTS_PER_SECOND,
     ):
         """
         Initialize SharePoint uploader.
@@ -73,6 +121,8 @@ class SharePointUploader:
             site_id: SharePoint site ID
             drive_id: Document library drive ID
             base_folder: Base folder path in SharePoint
+            pool_size: Keep-alive connections per host (match the worker count)
+            max_requests_per_second: Graph request rate cap (0 disables it)
         """
         self.access_token = access_token
         self.site_id = site_id
@@ -85,6 +135,19 @@ class SharePointUploader:
                 "Content-Type": "application/json",
             }
         )
+        # Upload-session URLs are pre-authenticated and must not carry the
+        # bearer token, so chunk PUTs go through a separate bare session.
+        self.upload_session = requests.Session()
+        for session in (self.session, self.upload_session):
+            session.mount(
+                "https://",
+                HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size)),
+            )
+        # Folder paths already confirmed to exist, so repeat uploads into the
+        # same date folder skip the per-segment Graph probes.
+        self._known_folders: set[str] = set()
+        self._folder_lock = threading.Lock()
+        self._rate_limiter = _RateLimiter(max_requests_per_second)
 
     def _get_folder_path(self, source: str, date_str: str) -> str:
         """Build SharePoint folder path for a given source and date."""
@@ -104,7 +167,8 @@ class SharePointUploader:
                     return max(float(retry_after), 0.0)
                 except ValueError:
                     pass
-        return min(2 ** (attempt - 1), 30)
+        # Jitter keeps concurrent workers that failed together from retrying in lockstep.
+        return min(2 ** (attempt - 1), 30) + random.uniform(0, 0.5)
 
     def _request_with_retry(
         self,
@@ -115,10 +179,11 @@ class SharePointUploader:
         **kwargs,
     ) -> requests.Response:
         """Make an HTTP request with retries for transient Graph/API failures."""
-        requester = self.session.request if use_session else requests.request
+        requester = self.session.request if use_session else self.upload_session.request
 
         for attempt in range(1, self.MAX_RETRIES + 1):
             response = None
+            self._rate_limiter.acquire()
             try:
                 response = requester(
                     method,
@@ -163,9 +228,18 @@ class SharePointUploader:
         raise RuntimeError(f"Failed request to {url} after retries")
 
     def _upload_file_chunked(
-        self, file_content: bytes, folder_path: str, filename: str, file_size_mb: float
+        self,
+        file_obj: BinaryIO,
+        file_size: int,
+        folder_path: str,
+        filename: str,
+        file_size_mb: float,
     ) -> bool:
-        """Upload large files using Microsoft Graph upload session."""
+        """Upload large files using Microsoft Graph upload session.
+
+        Chunks are read from ``file_obj`` one at a time, so only a single
+        chunk is held in memory regardless of the file size.
+        """
         create_session_url = (
             f"{self.BASE_URL}/sites/{self.site_id}/drives/{self.drive_id}"
             f"/root:/{folder_path}/{filename}:/createUploadSession"
@@ -190,10 +264,12 @@ class SharePointUploader:
             log.error(f"✗ Upload session response missing uploadUrl for {filename}")
             return False
 
-        file_size = len(file_content)
         for start in range(0, file_size, self.CHUNK_UPLOAD_SIZE_BYTES):
-            end = min(start + self.CHUNK_UPLOAD_SIZE_BYTES, file_size) - 1
-            chunk = file_content[start : end + 1]
+            chunk = file_obj.read(self.CHUNK_UPLOAD_SIZE_BYTES)
+            if not chunk:
+                log.error(f"✗ Source for {filename} ended before {file_size} bytes")
+                return False
+            end = start + len(chunk) - 1
             headers = {
                 "Content-Length": str(len(chunk)),
                 "Content-Range": f"bytes {start}-{end}/{file_size}",
@@ -224,17 +300,32 @@ class SharePointUploader:
         log.error(f"✗ Upload session did not complete for {filename}")
         return False
 
-    def _ensure_folder_exists(self, folder_path: str) -> dict:
+    def _ensure_folder_exists(self, folder_path: str) -> Optional[dict]:
         """
         Ensure a folder exists in SharePoint, creating it if necessary.
 
-        Returns the folder's metadata dict.
+        Returns the folder's metadata dict, or None if the folder was already
+        confirmed to exist by an earlier call.
         """
+        if folder_path in self._known_folders:
+            return None
+
+        # Serialize the probe/create walk: concurrent transfers into a new folder
+        # would otherwise each POST it, and conflictBehavior=replace lets a late
+        # create wipe files a sibling already uploaded.
+        with self._folder_lock:
+            if folder_path in self._known_folders:
+                return None
+            return self._create_folder_path(folder_path)
+
+    def _create_folder_path(self, folder_path: str) -> dict:
+        """Walk ``folder_path`` segment by segment, creating missing levels."""
         # Try to get the folder first
         url = f"{self.BASE_URL}/sites/{self.site_id}/drives/{self.drive_id}/root:/{folder_path}"
         response = self._request_with_retry("GET", url)
 
         if response.status_code == 200:
+            self._known_folders.add(folder_path)
             return response.json()
         if response.status_code != 404:
             raise Exception(f"Failed to check folder: {response.status_code}")
@@ -250,12 +341,15 @@ class SharePointUploader:
 
             parent_path = current_path if current_path else ""
             current_path = f"{current_path}/{part}" if current_path else part
+            if current_path in self._known_folders:
+                continue
 
             # Check if this level exists
             check_url = f"{self.BASE_URL}/sites/{self.site_id}/drives/{self.drive_id}/root:/{current_path}"
             check_response = self._request_with_retry("GET", check_url)
 
             if check_response.status_code == 200:
+                self._known_folders.add(current_path)
                 continue
             if check_response.status_code != 404:
                 raise Exception(f"Failed to check folder level: {check_response.status_code}")
@@ -282,6 +376,7 @@ class SharePointUploader:
                 raise Exception(
                     f"Failed to create folder: {create_response.status_code}"
                 )
+            self._known_folders.add(current_path)
 
         # Get the final folder metadata
         final_url = f"{self.BASE_URL}/sites/{self.site_id}/drives/{self.drive_id}/root:/{folder_path}"
@@ -292,8 +387,28 @@ class SharePointUploader:
                 f"Failed to get folder after creation: {final_response.status_code}"
             )
 
+        self._known_folders.add(folder_path)
         return final_response.json()
 
+    def remote_file_size(self, filename: str, source: str, date_str: str) -> Optional[int]:
+        """Return the size of an already-uploaded file, or None if it is absent."""
+        folder_path = self._get_folder_path(source, date_str)
+        url = (
+            f"{self.BASE_URL}/sites/{self.site_id}/drives/{self.drive_id}"
+            f"/root:/{folder_path}/{filename}"
+        )
+        try:
+            response = self._request_with_retry("GET", url, params={"$select": "size"})
+        except requests.RequestException as e:
+            log.warning(f"Could not check existing {folder_path}/{filename}: {e}")
+            return None
+        if response.status_code != 200:
+            return None
+        try:
+            return int(response.json()["size"])
+        except (ValueError, KeyError, TypeError):
+            return None
+
     def upload_file(
         self,
         file_content: bytes,
@@ -312,11 +427,33 @@ class SharePointUploader:
             date_str: Date string (YYYY-MM-DD)
             dry_run: If True, don't actually upload
 
+        Returns:
+            True if upload successful, False otherwise
+        """
+        return self.upload_stream(
+            io.BytesIO(file_content), len(file_content), filename, source, date_str, dry_run
+        )
+
+    def upload_stream(
+        self,
+        file_obj: BinaryIO,
+        file_size: int,
+        filename: str,
+        source: str,
+        date_str: str,
+        dry_run: bool = False,
+    ) -> bool:
+        """
+        Upload a file-like object of known size to SharePoint.
+
+        Files over SIMPLE_UPLOAD_MAX_BYTES are read and sent one upload-session
+        chunk at a time instead of being buffered whole.
+
         Returns:
             True if upload successful, False otherwise
         """
         folder_path = self._get_folder_path(source, date_str)
-        file_size_mb = len(file_content) / (1024 * 1024)
+        file_size_mb = file_size / (1024 * 1024)
 
         if dry_run:
             log.info(
@@ -328,9 +465,9 @@ class SharePointUploader:
             # Ensure folder exists
             self._ensure_folder_exists(folder_path)
 
-            if len(file_content) > self.SIMPLE_UPLOAD_MAX_BYTES:
+            if file_size > self.SIMPLE_UPLOAD_MAX_BYTES:
                 return self._upload_file_chunked(
-                    file_content, folder_path, filename, file_size_mb
+                    file_obj, file_size, folder_path, filename, file_size_mb
                 )
 
             # Upload file using simple upload
@@ -339,17 +476,12 @@ class SharePointUploader:
                 f"/root:/{folder_path}/{filename}:/content"
             )
 
-            # Remove Content-Type for file upload
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-            }
-
+            # Override the session's JSON Content-Type for the binary body
             response = self._request_with_retry(
                 "PUT",
                 upload_url,
-                use_session=False,
-                headers=headers,
-                data=file_content,
+                headers={"Content-Type": "application/octet-stream"},
+                data=file_obj.read(),
             )
 
             if response.status_code in (200, 201):
@@ -382,6 +514,8 @@ class GCSDownloader:
         self.client = storage.Client()
         self.bucket = self.client.bucket(bucket_name)
         self.prefix = prefix.strip("/")
+        # Sizes seen while listing, so streaming decisions need no extra GET.
+        self._sizes: dict[str, int] = {}
 
     def list_parquet_files(self, source: str, date_str: str) -> List[str]:
         """
@@ -396,8 +530,57 @@ class GCSDownloader:
         """
         # Path format: raw/source=TSI/agg=raw/dt=2025-12-15/TSI-2025-12-15.parquet
         prefix = f"{self.prefix}/source={source}/agg=raw/dt={date_str}/"
-        blobs = self.bucket.list_blobs(prefix=prefix)
-        return [blob.name for blob in blobs if blob.name.endswith(".parquet")]
+        blob_names = []
+        for blob in self.bucket.list_blobs(prefix=prefix):
+            if blob.name.endswith(".parquet"):
+                self._sizes[blob.name] = blob.size
+                blob_names.append(blob.name)
+        return blob_names
+
+    def list_parquet_files_range(
+        self, source: str, start_date: str, end_date: str
+    ) -> dict[str, List[str]]:
+        """
+        List parquet files for every date in a range with a single listing.
+
+        Args:
+            source: Data source (TSI or WU)
+            start_date: First date (YYYY-MM-DD)
+            end_date: Last date, inclusive (YYYY-MM-DD)
+
+        Returns:
+            Blob names grouped by date string; dates with no files are absent
+        """
+        prefix = f"{self.prefix}/source={source}/agg=raw/"
+        day_after_end = (parse_date(end_date) + timedelta(days=1)).strftime("%Y-%m-%d")
+        blobs = self.bucket.list_blobs(
+            prefix=prefix,
+            start_offset=f"{prefix}dt={start_date}/",
+            end_offset=f"{prefix}dt={day_after_end}/",
+            fields="items(name,size),nextPageToken",
+        )
+        by_date: dict[str, List[str]] = {}
+        for blob in blobs:
+            match = DT_PARTITION_RE.search(blob.name)
+            if match and blob.name.endswith(".parquet"):
+                self._sizes[blob.name] = blob.size
+                by_date.setdefault(match.group(1), []).append(blob.name)
+        return by_date
+
+    def blob_size(self, blob_name: str) -> int:
+        """Return a blob's size in bytes, preferring the size seen when listing."""
+        size = self._sizes.get(blob_name)
+        if size is None:
+            blob = self.bucket.get_blob(blob_name)
+            if blob is None:
+                raise FileNotFoundError(f"gs://{self.bucket.name}/{blob_name} not found")
+            size = blob.size
+        return size
+
+    def open_blob(self, blob_name: str) -> BinaryIO:
+        """Open a blob for streaming reads in upload-chunk-sized ranges."""
+        blob = self.bucket.blob(blob_name)
+        return blob.open("rb", chunk_size=SharePointUploader.CHUNK_UPLOAD_SIZE_BYTES)
 
     def download_file(self, blob_name: str) -> bytes:
         """
@@ -413,11 +596,22 @@ class GCSDownloader:
         return blob.download_as_bytes()
 
 
+@lru_cache(maxsize=1024)
 def parse_date(date_str: str) -> datetime:
-    """Parse a date string in YYYY-MM-DD format."""
+    """Parse a date string in YYYY-MM-DD format (memoized; datetimes are immutable)."""
     try:
+        # fromisoformat is a C fast path, but on 3.11+ it also accepts times,
+        # compact and week dates (2025-W01-1 is 10 chars too), so only the
+        # zero-padded, dash-separated form takes it; the rest goes via strptime.
+        if (
+            len(date_str) == 10
+            and date_str[4] == date_str[7] == "-"
+            and date_str.isascii()
+            and (date_str[:4] + date_str[5:7] + date_str[8:]).isdigit()
+        ):
+            return datetime.fromisoformat(date_str)
         return datetime.strptime(date_str, "%Y-%m-%d")
-    except ValueError:
+    except (TypeError, ValueError):
         raise ValueError(f"Invalid date format: {date_str}. Expected YYYY-MM-DD")
 
 
@@ -438,13 +632,10 @@ def get_date_range(start_date: str, end_date: str) -> List[str]:
     if start > end:
         raise ValueError(f"Start date {start_date} is after end date {end_date}")
 
-    dates = []
-    current = start
-    while current <= end:
-        dates.append(current.strftime("%Y-%m-%d"))
-        current += timedelta(days=1)
-
-    return dates
+    return [
+        date.fromordinal(ordinal).isoformat()
+        for ordinal in range(start.toordinal(), end.toordinal() + 1)
+    ]
 
 
 def get_sharepoint_access_token(
@@ -536,12 +727,81 @@ def write_json_artifact(artifact_path: Path, payload: dict[str, Any]) -> bytes:
     return artifact_bytes
 
 
+def _sync_file(
+    gcs: GCSDownloader,
+    sharepoint: SharePointUploader,
+    source: str,
+    date_str: str,
+    blob_name: str,
+    dry_run: bool,
+    skip_existing: bool = False,
+) -> tuple[dict[str, Any], bool]:
+    """Download one blob and upload it; return its manifest entry and success flag.
+
+    With ``skip_existing``, a SharePoint copy of the same size counts as synced
+    and the blob is neither downloaded nor uploaded.
+    """
+    filename = Path(blob_name).name
+    file_metadata: dict[str, Any] = {
+        "source": source,
+        "date": date_str,
+        "gcs_blob_path": f"gs://{gcs.bucket.name}/{blob_name}",
+        "filename": filename,
+        "size_bytes": None,
+        "upload_status": "pending",
+        "error": None,
+    }
+
+    try:
+        file_size = gcs.blob_size(blob_name)
+        file_metadata["size_bytes"] = file_size
+    except Exception as e:
+        file_metadata["upload_status"] = "download_failed"
+        file_metadata["error"] = str(e)
+        log.error(f"Error downloading {blob_name}: {e}")
+        return file_metadata, False
+
+    if skip_existing and sharepoint.remote_file_size(filename, source, date_str) == file_size:
+        log.info(f"↷ Skipping {source}/{date_str}/{filename}: SharePoint copy matches size")
+        file_metadata["upload_status"] = "skipped_existing"
+        return file_metadata, True
+
+    log.info(f"Downloading {source}/{date_str}/{filename}...")
+    try:
+        # Large files stream GCS ranges straight into upload-session chunks
+        # rather than being held in memory whole.
+        if file_size > sharepoint.SIMPLE_UPLOAD_MAX_BYTES:
+            file_obj = gcs.open_blob(blob_name)
+        else:
+            file_obj = io.BytesIO(gcs.download_file(blob_name))
+    except Exception as e:
+        file_metadata["upload_status"] = "download_failed"
+        file_metadata["error"] = str(e)
+        log.error(f"Error downloading {blob_name}: {e}")
+        return file_metadata, False
+
+    with file_obj:
+        uploaded = sharepoint.upload_stream(
+            file_obj, file_size, filename, source, date_str, dry_run
+        )
+    if uploaded:
+        file_metadata["upload_status"] = "dry_run" if dry_run else "uploaded"
+        return file_metadata, True
+
+    file_metadata["upload_status"] = "upload_failed"
+    file_metadata["error"] = "Upload failed"
+    return file_metadata, False
+
+
 def sync_date(
     gcs: GCSDownloader,
     sharepoint: SharePointUploader,
     date_str: str,
     sources: List[str],
     dry_run: bool = False,
+    max_workers: int = DEFAULT_SYNC_WORKERS,
+    listings: Optional[dict[str, dict[str, List[str]]]] = None,
+    skip_existing: bool = False,
 ) -> tuple[int, int]:
     """
     Sync parquet files for a specific date.
@@ -552,60 +812,65 @@ def sync_date(
         date_str: Date string (YYYY-MM-DD)
         sources: List of data sources to sync (e.g., ['TSI', 'WU'])
         dry_run: If True, don't actually upload
+        max_workers: Number of files transferred concurrently
+        listings: Pre-listed blob names keyed by source then date; sources
+            missing from it are listed for this date individually
+        skip_existing: Skip files whose SharePoint copy already has the same size
 
     Returns:
         Tuple of (success_count, total_count)
     """
-    success_count = 0
-    total_count = 0
-    manifest_entries: list[dict[str, Any]] = []
     missing_source_files: list[str] = []
+    transfers: list[tuple[str, str]] = []
 
     for source in sources:
         try:
-            blob_names = gcs.list_parquet_files(source, date_str)
-
-            if not blob_names:
-                log.warning(f"No parquet files found for {source} on {date_str}")
-                missing_source_files.append(source)
-                continue
-
-            for blob_name in blob_names:
-                total_count += 1
-                filename = Path(blob_name).name
-                file_metadata: dict[str, Any] = {
-                    "source": source,
-                    "date": date_str,
-                    "gcs_blob_path": f"gs://{gcs.bucket.name}/{blob_name}",
-                    "filename": filename,
-                    "size_bytes": None,
-                    "upload_status": "pending",
-                    "error": None,
-                }
-
-                log.info(f"Downloading {source}/{date_str}/{filename}...")
-                try:
-                    file_content = gcs.download_file(blob_name)
-                    file_metadata["size_bytes"] = len(file_content)
-                except Exception as e:
-                    file_metadata["upload_status"] = "download_failed"
-                    file_metadata["error"] = str(e)
-                    manifest_entries.append(file_metadata)
-                    log.error(f"Error downloading {blob_name}: {e}")
-                    continue
-
-                if sharepoint.upload_file(file_content, filename, source, date_str, dry_run):
-                    success_count += 1
-                    file_metadata["upload_status"] = "dry_run" if dry_run else "uploaded"
-                else:
-                    file_metadata["upload_status"] = "upload_failed"
-                    file_metadata["error"] = "Upload failed"
-
-                manifest_entries.append(file_metadata)
-
+            if listings is not None and source in listings:
+                blob_names = listings[source].get(date_str, [])
+            else:
+                blob_names = gcs.list_parquet_files(source, date_str)
         except Exception as e:
             log.error(f"Error syncing {source} for {date_str}: {e}")
             missing_source_files.append(source)
+            continue
+
+        if not blob_names:
+            log.warning(f"No parquet files found for {source} on {date_str}")
+            missing_source_files.append(source)
+            continue
+
+        if not dry_run:
+            # Create the target folder once up front so concurrent uploads into
+            # it never race on folder creation.
+            try:
+                sharepoint._ensure_folder_exists(
+                    sharepoint._get_folder_path(source, date_str)
+                )
+            except Exception as e:
+                log.warning(f"Could not pre-create folder for {source}/{date_str}: {e}")
+
+        transfers.extend((source, blob_name) for blob_name in blob_names)
+
+    # Transfers are I/O-bound (GCS GET + Graph PUT), so overlap them.
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        results = list(
+            pool.map(
+                lambda transfer: _sync_file(
+                    gcs,
+                    sharepoint,
+                    transfer[0],
+                    date_str,
+                    transfer[1],
+                    dry_run,
+                    skip_existing,
+                ),
+                transfers,
+            )
+        )
+
+    manifest_entries = [file_metadata for file_metadata, _ in results]
+    success_count = sum(1 for _, ok in results if ok)
+    total_count = len(transfers)
 
     generated_at = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
     manifest_payload = {
@@ -699,6 +964,12 @@ def main():
         help="Show what would be synced without uploading",
     )
 
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip files already in SharePoint with the same size (for resuming backfills)",
+    )
+
     parser.add_argument(
         "--gcs-bucket",
         default=os.getenv("GCS_BUCKET", "sensor-data-to-bigquery"),
@@ -711,6 +982,23 @@ def main():
         help="GCS prefix path (default: raw)",
     )
 
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=DEFAULT_GRAPH_REQUESTS_PER_SECOND,
+        help=(
+            "Cap on Microsoft Graph requests per second across all workers "
+            f"(default: {DEFAULT_GRAPH_REQUESTS_PER_SECOND:g}, 0 disables)"
+        ),
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_SYNC_WORKERS,
+        help=f"Files transferred concurrently per date (default: {DEFAULT_SYNC_WORKERS})",
+    )
+
     args = parser.parse_args()
 
     # Validate date range arguments
@@ -758,6 +1046,8 @@ def main():
         sharepoint_site_id,
         sharepoint_drive_id,
         sharepoint_folder,
+        pool_size=args.workers,
+        max_requests_per_second=args.max_rps,
     )
 
     # Sync files
@@ -766,13 +1056,31 @@ def main():
 
     log.info(f"Syncing {len(dates)} date(s) for sources: {', '.join(args.sources)}")
 
+    # One listing per source covers the whole range instead of one per date.
+    listings: dict[str, dict[str, List[str]]] = {}
+    if len(dates) > 1:
+        for source in args.sources:
+            try:
+                listings[source] = gcs.list_parquet_files_range(
+                    source, dates[0], dates[-1]
+                )
+            except Exception as e:
+                log.warning(f"Range listing failed for {source}, listing per date: {e}")
+
     total_success = 0
     total_files = 0
 
     for i, date_str in enumerate(dates, 1):
         log.info(f"[{i}/{len(dates)}] Syncing {date_str}...")
         success, total = sync_date(
-            gcs, sharepoint, date_str, args.sources, args.dry_run
+            gcs,
+            sharepoint,
+            date_str,
+            args.sources,
+            args.dry_run,
+            args.workers,
+            listings,
+            args.skip_existing,
         )
         total_success += success
         total_files += total
@@ -39,18 +39,25 @@ print()
 success = 0
 failed = 0
 
-# Copy tables
+# Copy tables. Copy jobs run server-side, so submit them all before waiting on
+# any; wall time is then the slowest copy rather than the sum of all of them.
 print("Copying tables...")
+job_config = bigquery.CopyJobConfig()
+job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
+
+copy_jobs = []
 for table_name in TABLES:
     src = f"{PROJECT}.{PROD_DS}.{table_name}"
     dst = f"{PROJECT}.{GRAFANA_DS}.{table_name}"
 
     try:
-        dest_table_id = dst
-        job_config = bigquery.CopyJobConfig()
-        job_config.write_disposition = bigquery.WriteDisposition.WRITE_TRUNCATE
+        copy_jobs.append((table_name, client.copy_table(src, dst, job_config=job_config)))
+    except Exception as e:
+        print(f"  {table_name}... ❌ {str(e)[:60]}")
+        failed += 1
 
-        copy_job = client.copy_table(src, dest_table_id, job_config=job_config)
+for table_name, copy_job in copy_jobs:
+    try:
         copy_job.result()
 
         print(f"  {table_name}... ✅")
@@ -32,7 +32,10 @@ def main() -> int:
         print(f"Research-pack directory not found: {date_dir}", file=sys.stderr)
         return 2
 
-    files = sorted([p for p in date_dir.iterdir() if p.is_file()])
+    # scandir reports each entry's type from the directory read itself, so
+    # filtering to files needs no per-entry stat().
+    with os.scandir(date_dir) as entries:
+        files = sorted(Path(entry.path) for entry in entries if entry.is_file())
     if not files:
         print(f"No research-pack files found in: {date_dir}", file=sys.stderr)
         return 2
@@ -57,9 +60,13 @@ def main() -> int:
 
     success = 0
     for file_path in files:
-        content = file_path.read_bytes()
-        if uploader.upload_file(content, file_path.name, args.scope_folder, args.date, args.dry_run):
-            success += 1
+        # Stream from disk: files over the simple-upload limit go up through a
+        # chunked upload session without being read into memory whole.
+        with open(file_path, "rb") as fh:
+            if uploader.upload_stream(
+                fh, file_path.stat().st_size, file_path.name, args.scope_folder, args.date, args.dry_run
+            ):
+                success += 1
 
     if success != len(files):
         print(f"Uploaded {success}/{len(files)} research-pack files.", file=sys.stderr)
@@ -161,6 +161,22 @@ def table_row_count(client: bigquery.Client, dataset_id: str, table: str, date:
         return None
 
 
+def native_table_row_counts(client: bigquery.Client, dataset_id: str) -> Dict[str, int]:
+    """Row counts for every native table in the dataset from one metadata query.
+
+    Reads ``__TABLES__`` instead of running a COUNT(*) job per table. Views and
+    external tables (type != 1) are left out because their metadata row count is
+    not meaningful; callers fall back to table_row_count for those. Rows still in
+    the streaming buffer are not reflected in the metadata count.
+    """
+    sql = f"SELECT table_id, row_count FROM `{client.project}.{dataset_id}.__TABLES__` WHERE type = 1"
+    try:
+        return {row['table_id']: row['row_count'] for row in client.query(sql).result()}
+    except Exception as e:
+        log.warning(f"__TABLES__ row count query failed for {dataset_id}: {e}")
+        return {}
+
+
 def simulate_load_paths(bucket: str, prefix: str, date: str) -> List[str]:
     paths = []
     for src in ["WU", "TSI"]:
@@ -396,8 +412,13 @@ def gather_row_related(client: bigquery.Client, args: VArgs, tables: list[str])
         processors.append('epoch')
 
     wants_table_obj = bool(processors)
+    # Undated counts are whole-table counts, which table metadata already has.
+    metadata_counts = {} if args.date else native_table_row_counts(client, args.dataset)
     for t in tables:
-        row_counts[t] = table_row_count(client, args.dataset, t, args.date)
+        if t in metadata_counts:
+            row_counts[t] = metadata_counts[t]
+        else:
+            row_counts[t] = table_row_count(client, args.dataset, t, args.date)
         tbl = _maybe_get_table(client, args.dataset, t) if wants_table_obj else None
         for proc in processors:
             if proc == 'schema':
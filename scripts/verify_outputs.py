@@ -78,7 +78,7 @@ def _external_table_row_count(client: bigquery.Client, project: str, dataset: st
     sql = f"""
     SELECT COUNT(*) c
     FROM `{project}.{dataset}.{external_table}`
-    WHERE REGEXP_CONTAINS(_FILE_NAME, @dtpath)
+    WHERE STRPOS(_FILE_NAME, @dtpath) > 0
     """
     job = client.query(sql, job_config=bigquery.QueryJobConfig(
         query_parameters=[bigquery.ScalarQueryParameter("dtpath", "STRING", f"/dt={date.isoformat()}/")]
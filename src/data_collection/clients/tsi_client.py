@@ -292,7 +292,8 @@ class TSIClient(BaseClient):
         df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', utc=True)
         
         # Filter to only include records from the target date
-        df = df[df['timestamp'].dt.date == target_date.date()]
+        # Compare floored UTC timestamps rather than building per-row date objects.
+        df = df[df['timestamp'].dt.floor('D') == pd.Timestamp(target_date, tz='UTC')]
         
         if df.empty:
             log.info(f"No data for target date {date_iso} after filtering (start_date/end_date returned data from other dates).")
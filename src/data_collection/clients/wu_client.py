@@ -308,8 +308,11 @@ class WUClient(BaseClient):
             log.warning("No valid data after concatenation.")
             return pd.DataFrame()
 
-        log.info("Converting obsTimeUtc to datetime...")
-        raw_df['obsTimeUtc'] = pd.to_datetime(raw_df['obsTimeUtc'])
+        # Per-request frames are already parsed for date filtering; only convert
+        # when concat fell back to object dtype (e.g. mixed offsets).
+        if not pd.api.types.is_datetime64_any_dtype(raw_df['obsTimeUtc']):
+            log.info("Converting obsTimeUtc to datetime...")
+            raw_df['obsTimeUtc'] = pd.to_datetime(raw_df['obsTimeUtc'])
         if {'stationID', 'obsTimeUtc'}.issubset(raw_df.columns):
             # Collapse overlap between HOURLY and MULTIDAY requests on same timestamp.
             # For duplicate rows, keep the first non-null value per column.
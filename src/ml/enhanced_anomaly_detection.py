@@ -15,6 +15,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import json
 import warnings
+import pandas as pd
 from typing import Dict, List
 import smtplib
 import requests
@@ -37,6 +38,10 @@ warnings.filterwarnings('ignore')
 class EnhancedAnomalyDetector(AnomalyDetectionSystem):
     """Enhanced anomaly detection system with automated alerting capabilities."""
     
+    # Alerts kept in the history file, and the size at which it is trimmed back.
+    ALERT_HISTORY_LIMIT = 1000
+    ALERT_HISTORY_COMPACT_BYTES = 4 * 1024 * 1024
+    
     def __init__(self, base_dir=None):
         super().__init__(base_dir)
         
@@ -51,6 +56,7 @@ class EnhancedAnomalyDetector(AnomalyDetectionSystem):
         
         # Setup logging
         self.setup_logging()
+        self.history_file = self._resolve_history_file()
         
         print("🚨 Enhanced Anomaly Detection System initialized")
         print(f"📧 Alerts directory: {self.alerts_dir}")
@@ -103,7 +109,7 @@ class EnhancedAnomalyDetector(AnomalyDetectionSystem):
                 "file_alerts": {
                     "enabled": True,
                     "alert_file": "current_alerts.json",
-                    "history_file": "alert_history.json"
+                    "history_file": "alert_history.jsonl"
                 }
             },
             "alert_rules": {
@@ -133,6 +139,36 @@ class EnhancedAnomalyDetector(AnomalyDetectionSystem):
         
         return default_config
 
+    def _resolve_history_file(self) -> Path:
+        """Return the JSON Lines alert history path, migrating a legacy array once.
+        
+        Older configs name ``alert_history.json``, a single JSON array. Appending
+        lines to that file would corrupt it, so any name not ending in ``.jsonl``
+        is redirected to the same stem with ``.jsonl``; if the legacy array file
+        exists and the JSONL one does not yet, its entries are copied over. The
+        legacy file itself is left untouched.
+        """
+        configured = self.alerts_dir / self.alert_config['notification_channels']['file_alerts']['history_file']
+        if configured.suffix == '.jsonl':
+            return configured
+        
+        history_file = configured.with_suffix('.jsonl')
+        self.logger.warning(f"Alert history is JSON Lines; writing {history_file.name} instead of {configured.name}")
+        if configured.exists() and not history_file.exists():
+            try:
+                with open(configured, 'r') as f:
+                    legacy = json.load(f)
+                if not isinstance(legacy, list):
+                    raise ValueError("expected a JSON array")
+                recent = legacy[-self.ALERT_HISTORY_LIMIT:]
+                with open(history_file, 'w') as f:
+                    for entry in recent:
+                        f.write(json.dumps(entry, default=str) + "\n")
+                self.logger.info(f"Migrated {len(recent)} alerts from {configured.name} to {history_file.name}")
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Could not migrate legacy alert history {configured}: {e}")
+        return history_file
+
     def setup_logging(self):
         """Setup logging for alert system."""
         log_file = self.alerts_dir / "alert_system.log"
@@ -370,10 +406,12 @@ class EnhancedAnomalyDetector(AnomalyDetectionSystem):
         
         # Add to active alerts
         self.active_alerts[alert_id] = alert
+        # Stamp once so the history file and in-memory history agree
+        processed_at = datetime.now().isoformat()
         
         # Send notifications
         if self.alert_config['notification_channels']['file_alerts']['enabled']:
-            self._send_file_alert(alert)
+            self._send_file_alert(alert, processed_at)
         
         if self.alert_config['notification_channels']['email']['enabled']:
             self._send_email_alert(alert)
@@ -384,7 +422,7 @@ class EnhancedAnomalyDetector(AnomalyDetectionSystem):
         # Add to history
         self.alert_history.append({
             **alert,
-            'processed_at': datetime.now().isoformat()
+            'processed_at': processed_at
         })
         
         self.logger.info(f"Alert processed: {alert_id} - {alert['message']}")
@@ -403,7 +441,7 @@ class EnhancedAnomalyDetector(AnomalyDetectionSystem):
         
         return len(recent_alerts) > 0
 
-    def _send_file_alert(self, alert: Dict):
+    def _send_file_alert(self, alert: Dict, processed_at: str):
         """Save alert to file system."""
         try:
             # Update current alerts file
@@ -422,28 +460,20 @@ class EnhancedAnomalyDetector(AnomalyDetectionSystem):
             with open(alerts_file, 'w') as f:
                 json.dump(current_alerts, f, indent=2)
             
-            # Update history file
-            history_file = self.alerts_dir / self.alert_config['notification_channels']['file_alerts']['history_file']
-            history = []
-            
-            if history_file.exists():
-                try:
-                    with open(history_file, 'r') as f:
-                        history = json.load(f)
-                except Exception:
-                    history = []
+            # Append to the history file (one JSON object per line) instead of
+            # re-reading and rewriting the whole array for every alert.
+            history_file = self.history_file
+            entry = json.dumps({**alert, 'processed_at': processed_at}, default=str)
+            with open(history_file, 'a') as f:
+                f.write(entry + "\n")
             
-            history.append({
-                **alert,
-                'processed_at': datetime.now().isoformat()
-            })
-            
-            # Keep only last 1000 alerts in history
-            if len(history) > 1000:
-                history = history[-1000:]
-            
-            with open(history_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            # Trim to the most recent alerts only once the file has grown well
+            # past that size, so the rewrite cost is amortized over many appends.
+            if history_file.stat().st_size > self.ALERT_HISTORY_COMPACT_BYTES:
+                with open(history_file, 'r') as f:
+                    recent = f.readlines()[-self.ALERT_HISTORY_LIMIT:]
+                with open(history_file, 'w') as f:
+                    f.writelines(recent)
             
             self.logger.info(f"File alert saved: {alert['id']}")
             
@@ -560,35 +590,28 @@ This is an automated alert from the Hot Durham monitoring system.
     def generate_alert_summary(self) -> Dict:
         """Generate summary of recent alerts."""
         try:
-            # Get alerts from last 24 hours
-            last_24h = datetime.now() - timedelta(hours=24)
-            recent_alerts = [
-                alert for alert in self.alert_history
-                if datetime.fromisoformat(alert['timestamp']) > last_24h
-            ]
+            # Get alerts from last 24 hours. Parse the timestamps and count in
+            # one vectorized pass rather than per alert in Python.
+            now = datetime.now()
+            last_24h = now - timedelta(hours=24)
+            history = pd.DataFrame(self.alert_history, columns=['timestamp', 'level', 'type'])
+            recent = history[pd.to_datetime(history['timestamp'], format='ISO8601') > last_24h]
             
-            # Count by level and type
-            level_counts = {}
-            type_counts = {}
-            
-            for alert in recent_alerts:
-                level = alert['level']
-                alert_type = alert['type']
-                
-                level_counts[level] = level_counts.get(level, 0) + 1
-                type_counts[alert_type] = type_counts.get(alert_type, 0) + 1
+            # Count by level and type (in order of first appearance)
+            level_counts = {k: int(v) for k, v in recent.groupby('level', sort=False).size().items()}
+            type_counts = {k: int(v) for k, v in recent.groupby('type', sort=False).size().items()}
             
             return {
                 'summary_period': '24_hours',
-                'total_alerts': len(recent_alerts),
+                'total_alerts': len(recent),
                 'active_alerts': len(self.active_alerts),
                 'alerts_by_level': level_counts,
                 'alerts_by_type': type_counts,
                 'recent_critical': [
-                    alert for alert in recent_alerts[-10:]
-                    if alert['level'] in ['critical', 'high']
+                    self.alert_history[i] for i in recent.index[-10:]
+                    if self.alert_history[i]['level'] in ['critical', 'high']
                 ],
-                'generated_at': datetime.now().isoformat()
+                'generated_at': now.isoformat()
             }
             
         except Exception as e:
@@ -15,6 +15,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import os
 import warnings
 from typing import Dict, List, Optional
 import joblib # pyright: ignore[reportMissingImports]
@@ -24,12 +25,65 @@ from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-import matplotlib.pyplot as plt
 
 # Statistical and time series
 
 warnings.filterwarnings('ignore')
 
+
+# Candidate timestamp columns, in the order _preprocess_historical_data tries them.
+TIMESTAMP_COLUMNS = ['timestamp', 'obsTimeUtc', 'iso_timestamp', 'cloud_timestamp']
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    """Read a CSV with pandas' multithreaded pyarrow parser.
+
+    The master/raw-pull CSVs are large and numeric-heavy, which is where the
+    Arrow reader is several times faster than the C engine; files it cannot
+    parse (ragged rows, odd quoting) fall back to the default engine.
+
+    Timestamp columns are read as strings by both engines. Arrow would
+    otherwise infer datetimes where the C engine keeps text, and a directory
+    mixing the two concatenates into an object column that to_datetime rejects.
+    """
+    dtype = {col: str for col in TIMESTAMP_COLUMNS}
+    try:
+        return pd.read_csv(path, engine="pyarrow", dtype=dtype)
+    except Exception:
+        return pd.read_csv(path, dtype=dtype)
+
+
+def _year_dir_csvs(source_dir: Path):
+    """Yield the CSV files under each year subdirectory of a raw_pulls source.
+
+    Uses os.scandir so entry types come from the directory listing rather
+    than a stat() per entry. The DirEntry objects are yielded as-is: they
+    carry .name and are path-like, so no Path is built per file.
+    """
+    with os.scandir(source_dir) as years:
+        year_paths = [entry.path for entry in years if entry.is_dir()]
+    for year_path in year_paths:
+        with os.scandir(year_path) as files:
+            for entry in files:
+                if entry.name.endswith(".csv") and entry.is_file():
+                    yield entry
+
+
+def _walk_csvs(root_dir: Path, limit: int):
+    """Count the CSV files under root_dir and return the first ``limit`` of them.
+
+    One os.walk pass with a running count, instead of materializing the full
+    recursive glob just to take its length.
+    """
+    first, count = [], 0
+    for dirpath, _dirnames, filenames in os.walk(root_dir):
+        for name in filenames:
+            if name.endswith(".csv"):
+                count += 1
+                if len(first) < limit:
+                    first.append(Path(dirpath, name))
+    return first, count
+
 class PredictiveAnalytics:
     """Comprehensive predictive analytics system for air quality forecasting."""
     
@@ -111,7 +165,7 @@ class PredictiveAnalytics:
                 for file in files_found:
                     try:
                         print(f"  📄 Reading file: {file.name}")
-                        df = pd.read_csv(file)
+                        df = _read_csv(file)
                         df['source_file'] = file.name
                         data_frames.append(df)
                         print(f"  ✅ Loaded: {file.name} ({len(df)} records)")
@@ -121,6 +175,9 @@ class PredictiveAnalytics:
                 if data_frames:
                     print(f"📊 Combining {len(data_frames)} data files...")
                     self.historical_data = pd.concat(data_frames, ignore_index=True)
+                    # Drop the per-file frames now rather than carrying a second
+                    # full copy of the data through preprocessing.
+                    data_frames.clear()
                     success = self._preprocess_historical_data()
                     if success:
                         print(f"📊 Total historical records: {len(self.historical_data)}")
@@ -141,13 +198,13 @@ class PredictiveAnalytics:
             print("📥 Trying processed directory as final fallback...")
             processed_dir = self.data_dir / "processed"
             if processed_dir.exists():
-                csv_files = list(processed_dir.glob("**/*.csv"))
+                csv_files, csv_count = _walk_csvs(processed_dir, limit=5)  # Limit to first 5 files
                 if csv_files:
-                    print(f"📂 Found {len(csv_files)} CSV files in processed directory")
+                    print(f"📂 Found {csv_count} CSV files in processed directory")
                     data_frames = []
-                    for file in csv_files[:5]:  # Limit to first 5 files
+                    for file in csv_files:
                         try:
-                            df = pd.read_csv(file)
+                            df = _read_csv(file)
                             df['source_file'] = file.name
                             data_frames.append(df)
                             print(f"  ✅ Loaded: {file.name} ({len(df)} records)")
@@ -156,6 +213,7 @@ class PredictiveAnalytics:
                     
                     if data_frames:
                         self.historical_data = pd.concat(data_frames, ignore_index=True)
+                        data_frames.clear()
                         success = self._preprocess_historical_data()
                         if success:
                             return True
@@ -175,41 +233,42 @@ class PredictiveAnalytics:
         wu_data = []
         wu_dir = raw_pulls_dir / "wu"
         if wu_dir.exists():
-            for year_dir in wu_dir.iterdir():
-                if year_dir.is_dir():
-                    for file in year_dir.glob("*.csv"):
-                        try:
-                            df = pd.read_csv(file)
-                            df['data_source'] = 'wu'
-                            df['source_file'] = file.name
-                            wu_data.append(df)
-                        except Exception as e:
-                            print(f"  ❌ Error loading WU file {file.name}: {e}")
+            for file in _year_dir_csvs(wu_dir):
+                try:
+                    df = _read_csv(file)
+                    df['data_source'] = 'wu'
+                    df['source_file'] = file.name
+                    wu_data.append(df)
+                except Exception as e:
+                    print(f"  ❌ Error loading WU file {file.name}: {e}")
         
         # Load TSI sensor data
         tsi_data = []
         tsi_dir = raw_pulls_dir / "tsi"
         if tsi_dir.exists():
-            for year_dir in tsi_dir.iterdir():
-                if year_dir.is_dir():
-                    for file in year_dir.glob("*.csv"):
-                        try:
-                            df = pd.read_csv(file)
-                            df['data_source'] = 'tsi'
-                            df['source_file'] = file.name
-                            tsi_data.append(df)
-                        except Exception as e:
-                            print(f"  ❌ Error loading TSI file {file.name}: {e}")
+            for file in _year_dir_csvs(tsi_dir):
+                try:
+                    df = _read_csv(file)
+                    df['data_source'] = 'tsi'
+                    df['source_file'] = file.name
+                    tsi_data.append(df)
+                except Exception as e:
+                    print(f"  ❌ Error loading TSI file {file.name}: {e}")
         
         # Combine and process
         all_data = []
+        # Release each source's per-file frames as soon as they are combined.
+        # weather_data, sensor_data and historical_data are all kept on self,
+        # so the combined copies still coexist; this only drops the per-file ones.
         if wu_data:
             self.weather_data = pd.concat(wu_data, ignore_index=True)
+            wu_data.clear()
             all_data.append(self.weather_data)
             print(f"  ✅ Weather data loaded: {len(self.weather_data)} records")
             
         if tsi_data:
             self.sensor_data = pd.concat(tsi_data, ignore_index=True)
+            tsi_data.clear()
             all_data.append(self.sensor_data)
             print(f"  ✅ Sensor data loaded: {len(self.sensor_data)} records")
         
@@ -225,8 +284,7 @@ class PredictiveAnalytics:
             return
         
         # Standardize timestamp column
-        timestamp_cols = ['timestamp', 'obsTimeUtc', 'iso_timestamp', 'cloud_timestamp']
-        for col in timestamp_cols:
+        for col in TIMESTAMP_COLUMNS:
             if col in self.historical_data.columns:
                 try:
                     self.historical_data['timestamp'] = pd.to_datetime(self.historical_data[col])
@@ -586,6 +644,9 @@ class PredictiveAnalytics:
             # Keep track of recent predictions for lag features
             recent_predictions = [current_conditions.get('pm25', 15.0)]
             
+            # Draw the ±5% prediction noise for every hour in one call
+            variations = np.random.default_rng().normal(0, 0.05, size=hours_ahead)
+            
             for hour in range(1, hours_ahead + 1):
                 future_time = base_time + timedelta(hours=hour)
                 
@@ -643,7 +704,7 @@ class PredictiveAnalytics:
                     
                     # Add some natural variation based on time and conditions
                     # Add slight random variation (±5%) to make predictions more realistic
-                    variation = np.random.normal(0, 0.05) * predicted_pm25
+                    variation = variations[hour - 1] * predicted_pm25
                     predicted_pm25 = max(0.0, predicted_pm25 + variation)
                     
                 except Exception as e:
@@ -905,6 +966,9 @@ class PredictiveAnalytics:
     def _create_seasonal_plots(self, data, decomposition, monthly_patterns, seasonal_patterns):
         """Create seasonal analysis visualizations."""
         try:
+            # Imported here so forecasting/API callers don't pay matplotlib's import cost
+            import matplotlib.pyplot as plt
+
             fig, axes = plt.subplots(2, 2, figsize=(16, 12))
             fig.suptitle('Seasonal Air Quality Analysis', fontsize=16, fontweight='bold')
             
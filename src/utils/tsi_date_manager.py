@@ -155,6 +155,20 @@ class TSIDateRangeManager:
     @classmethod
     def _parse_date(cls, date_str: str) -> datetime:
         """Parse date string in various formats."""
+        # Zero-padded YYYY-MM-DD, YYYY/MM/DD and YYYYMMDD are fixed-width, so
+        # slice the fields directly instead of trying strptime patterns in turn.
+        if len(date_str) == 10 and date_str[4] in "-/" and date_str[7] == date_str[4]:
+            fields = (date_str[:4], date_str[5:7], date_str[8:])
+        elif len(date_str) == 8:
+            fields = (date_str[:4], date_str[4:6], date_str[6:])
+        else:
+            fields = ()
+        if fields and all(f.isascii() and f.isdigit() for f in fields):
+            try:
+                return datetime(int(fields[0]), int(fields[1]), int(fields[2]))
+            except ValueError:
+                pass  # e.g. month 13; fall through to the usual error path
+        # Anything else (e.g. unpadded 2025-6-1) goes through strptime as before.
         for fmt in ["%Y-%m-%d", "%Y%m%d", "%Y/%m/%d"]:
             try:
                 return datetime.strptime(date_str, fmt)
@@ -1,7 +1,14 @@
 from argparse import Namespace
 from datetime import datetime, timedelta, timezone
 
-from scripts.check_data_quality import calculate_date_range
+import pytest
+
+from scripts.check_data_quality import (
+    _date_range_job_config,
+    _parse_ymd,
+    _ts_window,
+    calculate_date_range,
+)
 
 
 def test_days_range_uses_completed_utc_day():
@@ -27,3 +34,29 @@ def test_days_range_spans_from_completed_utc_day():
 
     assert start == expected_start.strftime("%Y-%m-%d")
     assert end == expected_end.strftime("%Y-%m-%d")
+
+
+def test_ts_window_bounds_raw_timestamp_with_date_parameters():
+    predicate = _ts_window("l.timestamp")
+    assert "DATE(l.timestamp)" not in predicate
+    assert "l.timestamp >= TIMESTAMP(@start_date)" in predicate
+
+    params = {
+        p.name: (p.type_, str(p.value))
+        for p in _date_range_job_config("2025-10-01", "2025-10-04").query_parameters
+    }
+    assert params == {
+        "start_date": ("DATE", "2025-10-01"),
+        "end_date": ("DATE", "2025-10-04"),
+    }
+
+
+@pytest.mark.parametrize("value", ["2025-W01-1", "20250101", "2025-01-01T12:00"])
+def test_parse_ymd_rejects_what_strptime_rejected(value):
+    with pytest.raises(ValueError):
+        _parse_ymd(value)
+
+
+def test_parse_ymd_matches_strptime_on_accepted_forms():
+    for value in ("2025-01-05", "2025-1-5"):
+        assert _parse_ymd(value) == datetime.strptime(value, "%Y-%m-%d")
@@ -0,0 +1,56 @@
+import datetime as dt
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from google.cloud import bigquery
+
+ROOT = Path(__file__).resolve().parents[2]
+OURA_DIR = ROOT / "oura-rings"
+
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(OURA_DIR))
+    import generate_health_dashboard
+
+    monkeypatch.setattr(generate_health_dashboard, "ENV_CACHE_DIR", tmp_path)
+    return generate_health_dashboard
+
+
+class _FakeClient:
+    modified = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+    queries = []
+
+    def __init__(self, project=None):
+        self.project = project
+
+    def get_table(self, table_id):
+        return SimpleNamespace(modified=_FakeClient.modified)
+
+    def query(self, query, job_config=None):
+        _FakeClient.queries.append(self.project)
+        frame = pd.DataFrame({"day": [dt.datetime(2026, 1, 1)], "residence_id": ["R1"]})
+        return SimpleNamespace(to_dataframe=lambda create_bqstorage_client: frame)
+
+
+def test_fetch_env_data_cache_follows_table_modified_time(dashboard, monkeypatch):
+    monkeypatch.setattr(bigquery, "Client", _FakeClient)
+    monkeypatch.setattr(_FakeClient, "queries", [])
+    monkeypatch.setenv("GCP_PROJECT_ID", "proj-a")
+
+    dashboard.fetch_env_data("2026-01-01", "2026-01-02")
+    dashboard.fetch_env_data("2026-01-01", "2026-01-02")
+    assert _FakeClient.queries == ["proj-a"]
+
+    # New rows landed (e.g. later today): the cached result is stale.
+    monkeypatch.setattr(_FakeClient, "modified", _FakeClient.modified + dt.timedelta(hours=1))
+    dashboard.fetch_env_data("2026-01-01", "2026-01-02")
+    assert _FakeClient.queries == ["proj-a", "proj-a"]
+
+    # Same range in another project does not share the cache entry.
+    monkeypatch.setenv("GCP_PROJECT_ID", "proj-b")
+    df = dashboard.fetch_env_data("2026-01-01", "2026-01-02")
+    assert _FakeClient.queries == ["proj-a", "proj-a", "proj-b"]
+    assert list(df["resident"]) == ["R1"]
@@ -0,0 +1,140 @@
+import datetime as dt
+
+import pyarrow as pa
+import pytest
+from google.api_core.exceptions import NotFound
+
+import scripts.generate_residence_assignments as mod
+
+
+TEMPLATE = """-- Residence assignments
+CREATE OR REPLACE TABLE `proj.sensors.residence_sensor_assignments` AS
+SELECT * FROM UNNEST([
+  ('RESIDENCE_A', 'dummy_sensor_id_in',  'SENSOR_A_IN',  'Indoor',  TIMESTAMP('2025-01-01 00:00:00'), NULL, CURRENT_TIMESTAMP()),
+  ('RESIDENCE_A', 'dummy_sensor_id_out', 'SENSOR_A_OUT', 'Outdoor', TIMESTAMP('2025-01-01 00:00:00'), NULL, CURRENT_TIMESTAMP())
+]);
+"""
+
+
+class _FakeRowIterator:
+    def __init__(self, table):
+        self._table = table
+
+    def to_arrow(self, create_bqstorage_client=False):
+        return self._table
+
+
+class _FakeQueryJob:
+    def __init__(self, table):
+        self._table = table
+
+    def result(self):
+        return _FakeRowIterator(self._table)
+
+
+class _FakeTable:
+    modified = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+
+
+class _FakeClient:
+    def __init__(self, table, missing_view=False):
+        self._table = table
+        self._missing_view = missing_view
+        self.queries = []
+
+    def get_table(self, table_ref):
+        return _FakeTable()
+
+    def query(self, query, **kwargs):
+        self.queries.append(query)
+        if self._missing_view and mod.MAPPING_VIEW in query:
+            raise NotFound("view not found")
+        return _FakeQueryJob(self._table)
+
+
+def _mapping_table():
+    return pa.table(
+        {
+            "sensor_name": ["SENSOR_A_IN", "SENSOR_A_OUT", "SENSOR_B"],
+            "native_sensor_ids": [["native-1"], ["native-2", "native-3"], []],
+        }
+    )
+
+
+def test_fetch_sensor_mapping_splits_unique_and_ambiguous():
+    client = _FakeClient(_mapping_table())
+    mapping, ambiguous = mod.fetch_sensor_mapping(client, "proj", "sensors")
+    assert mapping == {"SENSOR_A_IN": "native-1"}
+    assert ambiguous == {"SENSOR_A_OUT": ["native-2", "native-3"]}
+    assert "`proj.sensors.sensor_serial_to_native`" in client.queries[0]
+
+
+def test_fetch_sensor_mapping_falls_back_without_view():
+    client = _FakeClient(_mapping_table(), missing_view=True)
+    mapping, ambiguous = mod.fetch_sensor_mapping(client, "proj", "sensors")
+    assert mapping == {"SENSOR_A_IN": "native-1"}
+    assert len(client.queries) == 2
+    assert "`proj.sensors.tsi_raw_materialized`" in client.queries[1]
+
+
+def test_fetch_sensor_mapping_cached_skips_query_on_hit(tmp_path, monkeypatch):
+    monkeypatch.setattr(mod, "MAPPING_CACHE_DIR", tmp_path)
+    client = _FakeClient(_mapping_table())
+
+    first = mod.fetch_sensor_mapping_cached(client, "proj", "sensors")
+    second = mod.fetch_sensor_mapping_cached(client, "proj", "sensors")
+    assert first == second
+    assert len(client.queries) == 1
+
+    mod.fetch_sensor_mapping_cached(client, "proj", "sensors", refresh=True)
+    assert len(client.queries) == 2
+
+
+def test_substitute_template_replaces_known_sensors():
+    rendered, missing, replaced = mod.substitute_template(
+        TEMPLATE, {"SENSOR_A_IN": "native-1", "SENSOR_A_OUT": "native-2"}
+    )
+    assert replaced == 2
+    assert missing == set()
+    assert "'native-1'" in rendered
+    assert "'native-2'" in rendered
+    assert "dummy_sensor_id_in" not in rendered
+
+
+def test_substitute_template_reports_missing_and_keeps_other_lines():
+    rendered, missing, replaced = mod.substitute_template(
+        TEMPLATE, {"SENSOR_A_IN": "native-1"}
+    )
+    assert replaced == 1
+    assert missing == {"SENSOR_A_OUT"}
+    assert "'dummy_sensor_id_out'" in rendered
+    assert rendered.startswith("-- Residence assignments\n")
+    assert rendered.endswith("]);\n")
+
+
+def test_substitute_template_bytes_matches_str_path():
+    mapping = {"SENSOR_A_IN": "native-1"}
+    rendered, missing, replaced = mod.substitute_template(TEMPLATE, mapping)
+    rendered_bytes, missing_bytes, replaced_bytes = mod.substitute_template_bytes(
+        TEMPLATE.encode("utf-8"), mapping
+    )
+    assert rendered_bytes == rendered.encode("utf-8")
+    assert missing_bytes == missing
+    assert replaced_bytes == replaced
+
+
+def test_print_mapping_issues_truncates_to_max_issues(capsys):
+    missing = {f"SENSOR_{i:03d}" for i in range(10)}
+    mod.print_mapping_issues(missing, {}, max_issues=3)
+    err = capsys.readouterr().err
+    assert "SENSOR_000" in err and "SENSOR_002" in err
+    assert "SENSOR_003" not in err
+    assert "(+7 more)" in err
+
+
+def test_max_issues_must_be_non_negative(monkeypatch, capsys):
+    assert mod._non_negative_int("0") == 0
+    monkeypatch.setattr(mod.sys, "argv", ["prog", "--max-issues", "-1"])
+    with pytest.raises(SystemExit):
+        mod.main()
+    assert "--max-issues: must be >= 0" in capsys.readouterr().err
@@ -1,6 +1,10 @@
+import threading
+import time
 from unittest.mock import patch, MagicMock
 from importlib.util import spec_from_file_location, module_from_spec
 from pathlib import Path
+
+import pytest
 from google.cloud.exceptions import NotFound
 
 # Dynamically load the oura_bigquery_loader module (folder name has a hyphen)
@@ -83,3 +87,151 @@ def test_upload_frames_real(mock_client):
     assert all(isinstance(v, int) and v >= 1 for v in results.values())
     mock_client.assert_called_once()
     assert mock_instance.load_table_from_dataframe.call_count == 3
+    job_config = mock_instance.load_table_from_dataframe.call_args.kwargs["job_config"]
+    assert job_config.source_format == "PARQUET"
+    assert job_config.write_disposition == "WRITE_APPEND"
+
+
+@patch("google.cloud.bigquery.Client")
+def test_frame_batch_issues_one_load_per_table_across_residents(mock_client):
+    mock_instance = MagicMock()
+    mock_client.return_value = mock_instance
+    mock_instance.project = "demo-project"
+
+    batch = mod.FrameBatch(dataset="oura", table_prefix="oura", dry_run=False)
+    for resident in (1, 2, 3):
+        queued = batch.add(build_daily_frames(SAMPLE_DATA, resident_no=resident), resident)
+        assert queued["oura_daily_sleep"] == 1
+    mock_instance.load_table_from_dataframe.assert_not_called()
+
+    totals = batch.flush()
+
+    assert totals == {
+        "oura_daily_sleep": 3,
+        "oura_daily_activity": 3,
+        "oura_daily_readiness": 3,
+    }
+    assert mock_instance.load_table_from_dataframe.call_count == 3
+    uploaded = mock_instance.load_table_from_dataframe.call_args_list[0].args[0]
+    assert sorted(uploaded["resident"]) == [1, 2, 3]
+
+
+def test_frame_batch_flushes_early_past_byte_threshold():
+    batch = mod.FrameBatch(dataset="oura", dry_run=True, flush_bytes=1)
+    batch.add(build_daily_frames(SAMPLE_DATA, resident_no=1), 1)
+    # Already uploaded on add; flush has nothing pending but keeps the totals.
+    assert batch._pending == {}
+    assert batch.flush()["oura_daily_sleep"] == 1
+
+
+def test_frame_batch_blocks_adders_while_full_buffer_uploads(monkeypatch):
+    release = threading.Event()
+    uploads = []
+
+    def slow_upload(frames, **kwargs):
+        uploads.append(sorted(frames))
+        release.wait(timeout=5)
+        return {f"oura_{name}": len(df) for name, df in frames.items()}
+
+    monkeypatch.setattr(mod, "upload_frames_to_bigquery", slow_upload)
+    batch = mod.FrameBatch(dataset="oura", flush_bytes=1)
+
+    first = threading.Thread(
+        target=batch.add, args=(build_daily_frames(SAMPLE_DATA, resident_no=1), 1)
+    )
+    first.start()
+    while not uploads:
+        time.sleep(0.01)
+
+    # Buffer refills past the budget while the first upload is still running.
+    batch._pending_bytes = batch.flush_bytes
+    second = threading.Thread(
+        target=batch.add, args=(build_daily_frames(SAMPLE_DATA, resident_no=2), 2)
+    )
+    second.start()
+    second.join(timeout=0.2)
+    assert second.is_alive()
+
+    release.set()
+    first.join(timeout=5)
+    second.join(timeout=5)
+    assert not second.is_alive()
+    assert batch.flush()["oura_daily_sleep"] == 2
+
+
+@patch("google.cloud.bigquery.Client")
+def test_upload_frames_waits_on_all_jobs_and_reports_what_loaded(mock_client):
+    mock_instance = MagicMock()
+    mock_client.return_value = mock_instance
+    ok_job, bad_job = MagicMock(), MagicMock()
+    bad_job.result.side_effect = RuntimeError("schema mismatch")
+    mock_instance.load_table_from_dataframe.side_effect = [bad_job, ok_job, ok_job]
+
+    frames = build_daily_frames(SAMPLE_DATA, resident_no=1)
+    with pytest.raises(mod.BigQueryLoadError) as excinfo:
+        upload_frames_to_bigquery(frames, dataset="oura", dry_run=False)
+
+    assert set(excinfo.value.failed) == {"oura_daily_sleep"}
+    assert excinfo.value.loaded == {"oura_daily_activity": 1, "oura_daily_readiness": 1}
+    ok_job.result.assert_called()
+
+
+def test_frame_batch_records_failed_early_flush_per_resident(monkeypatch):
+    def failing_upload(frames, **kwargs):
+        raise mod.BigQueryLoadError(
+            {"oura_daily_sleep": RuntimeError("boom")},
+            {"oura_daily_activity": 2, "oura_daily_readiness": 2},
+        )
+
+    monkeypatch.setattr(mod, "upload_frames_to_bigquery", failing_upload)
+    batch = mod.FrameBatch(dataset="oura", flush_bytes=10**9)
+    batch.add(build_daily_frames(SAMPLE_DATA, resident_no=1), 1)
+    batch.flush_bytes = 1
+    # Resident 2's add triggers the early flush that carries resident 1 too.
+    batch.add(build_daily_frames(SAMPLE_DATA, resident_no=2), 2)
+
+    for resident in (1, 2):
+        loaded, failed = batch.export_status(resident)
+        assert loaded == {"oura_daily_activity": 1, "oura_daily_readiness": 1}
+        assert failed == ["oura_daily_sleep"]
+    assert batch.flush() == {"oura_daily_activity": 2, "oura_daily_readiness": 2}
+
+
+def test_frame_batch_skips_tables_already_loaded():
+    batch = mod.FrameBatch(
+        dataset="oura", already_loaded={1: {"oura_daily_activity": 1}}
+    )
+    queued = batch.add(build_daily_frames(SAMPLE_DATA, resident_no=1), 1)
+    assert set(queued) == {"oura_daily_sleep", "oura_daily_readiness"}
+    batch.flush()
+    loaded, failed = batch.export_status(1)
+    assert set(loaded) == {"oura_daily_sleep", "oura_daily_activity", "oura_daily_readiness"}
+    assert failed == []
+
+
+def test_frame_batch_flush_waiting_on_upload_sees_its_totals(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    def slow_upload(frames, **kwargs):
+        started.set()
+        release.wait(timeout=5)
+        return {f"oura_{name}": len(df) for name, df in frames.items()}
+
+    monkeypatch.setattr(mod, "upload_frames_to_bigquery", slow_upload)
+    batch = mod.FrameBatch(dataset="oura", flush_bytes=1)
+    adder = threading.Thread(
+        target=batch.add, args=(build_daily_frames(SAMPLE_DATA, resident_no=1), 1)
+    )
+    adder.start()
+    started.wait(timeout=5)
+
+    flushed = {}
+    flusher = threading.Thread(target=lambda: flushed.update(batch.flush()))
+    flusher.start()
+    release.set()
+    adder.join(timeout=5)
+    flusher.join(timeout=5)
+
+    # flush() was woken by the upload finishing, so it must include its rows.
+    assert flushed["oura_daily_sleep"] == 1
+    assert batch.export_status(1)[0]["oura_daily_sleep"] == 1
@@ -0,0 +1,168 @@
+import threading
+import time
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+OURA_DIR = ROOT / "oura-rings"
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    # cli.py attaches a FileHandler in the working directory at import time.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(OURA_DIR))
+    spec = spec_from_file_location("oura_cli_under_test", str(OURA_DIR / "cli.py"))
+    mod = module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(mod)  # type: ignore
+    yield mod
+    for handler in list(mod.logging.getLogger().handlers):
+        if isinstance(handler, mod.logging.FileHandler):
+            mod.logging.getLogger().removeHandler(handler)
+            handler.close()
+
+
+def test_main_processes_residents_concurrently_in_requested_order(cli, tmp_path, monkeypatch):
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def fake_process_resident(resident_no, *args, **kwargs):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        # Later residents finish first so completion order differs from input order.
+        time.sleep(0.05 * (4 - resident_no))
+        with lock:
+            active["now"] -= 1
+        return {"resident": resident_no, "status": "success", "daily_records": 1}
+
+    monkeypatch.setattr(cli, "process_resident", fake_process_resident)
+
+    results = cli.main(
+        ["--residents", "1", "2", "3", "--max-parallel", "3", "--output-dir", str(tmp_path)]
+    )
+
+    assert [r["resident"] for r in results] == [1, 2, 3]
+    assert active["peak"] > 1
+
+
+def test_main_resume_skips_completed_residents_and_dedupes(cli, tmp_path, monkeypatch):
+    calls = []
+    fail_once = {2}
+
+    def fake_process_resident(resident_no, *args, **kwargs):
+        calls.append(resident_no)
+        if resident_no in fail_once:
+            fail_once.discard(resident_no)
+            return {"resident": 2, "status": "error", "message": "boom"}
+        return {"resident": resident_no, "status": "success", "daily_records": 1}
+
+    monkeypatch.setattr(cli, "process_resident", fake_process_resident)
+    argv = [
+        "--residents", "1", "2", "1",
+        "--start", "2025-10-01", "--end", "2025-10-02",
+        "--output-dir", str(tmp_path),
+    ]
+
+    first = cli.main(argv)
+    assert sorted(calls) == [1, 2]
+    assert [r["status"] for r in first] == ["success", "error"]
+
+    calls.clear()
+    resumed = cli.main(argv + ["--resume"])
+    assert calls == [2]
+    assert [(r["resident"], r["status"]) for r in resumed] == [
+        (1, "success"),
+        (2, "success"),
+    ]
+
+
+def test_main_resume_reexports_only_tables_that_failed(cli, tmp_path, monkeypatch):
+    import oura_bigquery_loader as loader
+
+    frames = loader.build_daily_frames(
+        {
+            "sleep": [{"day": "2025-10-01", "score": 80}],
+            "activity": [{"day": "2025-10-01", "score": 70}],
+        },
+        resident_no=1,
+    )
+
+    def fake_process_resident(resident_no, *args):
+        bq_batch = args[-1]
+        return {
+            "resident": resident_no,
+            "status": "success",
+            "daily_records": 1,
+            "bq_export": bq_batch.add(frames, resident_no),
+        }
+
+    uploads = []
+
+    def flaky_upload(frames, **kwargs):
+        uploads.append(sorted(frames))
+        if len(uploads) == 1:
+            raise loader.BigQueryLoadError(
+                {"oura_daily_sleep": RuntimeError("boom")}, {"oura_daily_activity": 1}
+            )
+        return {f"oura_{name}": len(df) for name, df in frames.items()}
+
+    monkeypatch.setattr(cli, "process_resident", fake_process_resident)
+    monkeypatch.setattr(loader, "upload_frames_to_bigquery", flaky_upload)
+    argv = [
+        "--residents", "1", "--export-bq",
+        "--start", "2025-10-01", "--end", "2025-10-02",
+        "--output-dir", str(tmp_path),
+    ]
+
+    (first,) = cli.main(argv)
+    assert first["bq_export"] == {"oura_daily_activity": 1}
+    assert first["bq_export_failed"] == ["oura_daily_sleep"]
+
+    (resumed,) = cli.main(argv + ["--resume"])
+    assert uploads[1] == ["daily_sleep"]
+    assert resumed["bq_export"] == {"oura_daily_activity": 1, "oura_daily_sleep": 1}
+    assert "bq_export_failed" not in resumed
+
+
+def test_main_stop_on_error_still_collects_residents_already_running(cli, tmp_path, monkeypatch):
+    monkeypatch.setitem(cli.OPTIONS, "continue_on_error", False)
+    started = threading.Barrier(2)
+    calls = []
+
+    def fake_process_resident(resident_no, *args, **kwargs):
+        calls.append(resident_no)
+        if resident_no in (1, 2):
+            started.wait(timeout=5)
+        if resident_no == 1:
+            return {"resident": 1, "status": "error", "message": "boom"}
+        time.sleep(0.1)  # still running when resident 1 fails
+        return {"resident": resident_no, "status": "success", "daily_records": 1}
+
+    monkeypatch.setattr(cli, "process_resident", fake_process_resident)
+
+    results = cli.main(
+        ["--residents", "1", "2", "3", "4", "5", "--max-parallel", "2", "--output-dir", str(tmp_path)]
+    )
+
+    # Everything that ran is reported (so --resume won't redo it); the rest
+    # was cancelled before starting.
+    assert sorted(r["resident"] for r in results) == sorted(calls)
+    assert 2 in calls and len(calls) < 5
+
+
+def test_main_resume_with_fewer_residents_reports_only_those_requested(cli, tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        cli,
+        "process_resident",
+        lambda resident_no, *args: {"resident": resident_no, "status": "success", "daily_records": 1},
+    )
+    base = ["--start", "2025-10-01", "--end", "2025-10-02", "--output-dir", str(tmp_path)]
+
+    cli.main(["--residents", "1", "2", "3"] + base)
+    resumed = cli.main(["--residents", "1", "--resume"] + base)
+
+    assert [r["resident"] for r in resumed] == [1]
@@ -0,0 +1,152 @@
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+OURA_DIR = ROOT / "oura-rings"
+
+
+@pytest.fixture
+def client_mod(monkeypatch):
+    monkeypatch.syspath_prepend(str(OURA_DIR))
+    import oura_client
+
+    return oura_client
+
+
+class _Response:
+    def __init__(self, status_code, payload=None, headers=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _ScriptedSession:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        return self._responses.pop(0)
+
+
+def test_aimd_controller_backs_off_on_throttle_and_grows_on_success(client_mod):
+    controller = client_mod.AIMDController(initial=4, minimum=1, maximum=5)
+
+    controller.observe(0.1, _Response(429))
+    assert controller.limit == 2
+    controller.observe(0.1, _Response(200, headers={"x-ratelimit-remaining": "0"}))
+    assert controller.limit == 1
+    controller.observe(0.1, _Response(200))
+    assert controller.limit == 1.5
+    controller.observe(10.0, _Response(200))  # slower than target latency
+    assert controller.limit == 1
+
+
+def test_make_request_retries_throttled_responses(client_mod, monkeypatch):
+    clock = {"now": 1000.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(client_mod.time, "sleep", fake_sleep)
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: clock["now"])
+    client = client_mod.OuraClient("throttled-token")
+    client.session = _ScriptedSession(
+        [
+            _Response(429, headers={"Retry-After": "3"}),
+            _Response(503),
+            _Response(200, {"data": [1]}),
+        ]
+    )
+
+    assert client._make_request("GET", "v2/usercollection/daily_sleep") == {"data": [1]}
+    assert client.session.calls == 3
+    assert sleeps == [3.0, 2]
+
+
+def test_clients_sharing_a_token_share_one_rate_limiter(client_mod):
+    first = client_mod.OuraClient("shared-token", requests_per_minute=120)
+    second = client_mod.OuraClient("shared-token", requests_per_minute=120)
+    other = client_mod.OuraClient("other-token", requests_per_minute=120)
+
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is not other.rate_limiter
+    assert first.rate_limiter.rate == 2.0
+
+
+def test_token_bucket_spaces_requests_after_burst(client_mod, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: 50.0)
+    monkeypatch.setattr(client_mod.time, "sleep", sleeps.append)
+
+    bucket = client_mod.TokenBucket(rate=5, burst=1)
+    for _ in range(3):
+        bucket.acquire()
+
+    assert sleeps == [0.2, 0.4]
+
+
+def test_rejected_token_fails_fast_without_further_requests(client_mod):
+    client = client_mod.OuraClient("revoked-token")
+    client.session = _ScriptedSession([_Response(401)])
+
+    with pytest.raises(client_mod.OuraAuthError, match="401"):
+        client._make_request("GET", "v2/usercollection/daily_sleep")
+    with pytest.raises(client_mod.OuraAuthError):
+        client.get_heart_rate("2025-10-01", "2025-10-02")
+
+    assert client.session.calls == 1
+
+
+def test_throttle_pauses_every_client_sharing_the_token(client_mod, monkeypatch):
+    clock = {"now": 2000.0}
+    sleeps = []
+    monkeypatch.setattr(client_mod.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(client_mod.time, "sleep", sleeps.append)
+    first = client_mod.OuraClient("paused-token")
+    second = client_mod.OuraClient("paused-token")
+    first.session = _ScriptedSession(
+        [_Response(429, headers={"Retry-After": "7"}), _Response(200, {"data": []})]
+    )
+    second.session = _ScriptedSession([_Response(200, {"data": []})])
+
+    first._make_request("GET", "v2/usercollection/daily_sleep")
+    second._make_request("GET", "v2/usercollection/heart_rate")
+
+    # The clock is frozen, so the second client asks inside the same window;
+    # both wait it out on the shared limiter.
+    assert sleeps == [7.0, 7.0]
+
+
+def test_aimd_controller_backs_off_when_quota_runs_low(client_mod):
+    controller = client_mod.AIMDController(initial=4, minimum=1, maximum=8)
+
+    controller.observe(
+        0.1, _Response(200, headers={"x-ratelimit-limit": "100", "x-ratelimit-remaining": "50"})
+    )
+    assert controller.limit == 4.5
+    controller.observe(
+        0.1, _Response(200, headers={"x-ratelimit-limit": "100", "x-ratelimit-remaining": "9"})
+    )
+    assert controller.limit == 2.25
+
+
+def test_max_retries_caps_throttled_attempts(client_mod, monkeypatch):
+    monkeypatch.setattr(client_mod.time, "sleep", lambda s: None)
+    client = client_mod.OuraClient("capped-token", max_retries=2)
+    client.session = _ScriptedSession([_Response(429), _Response(429)])
+
+    with pytest.raises(RuntimeError, match="HTTP 429"):
+        client._make_request("GET", "v2/usercollection/daily_sleep")
+    assert client.session.calls == 2
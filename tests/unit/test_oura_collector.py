@@ -0,0 +1,102 @@
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+OURA_DIR = ROOT / "oura-rings"
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    monkeypatch.syspath_prepend(str(OURA_DIR))
+    import oura_collector
+
+    return oura_collector
+
+
+class _SlowClient:
+    """Fake OuraClient whose endpoints block briefly and track overlap."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if not name.startswith("get_"):
+            raise AttributeError(name)
+
+        def fetch(start_date=None, end_date=None):
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.02)
+            with self._lock:
+                self.active -= 1
+            return [{"endpoint": name, "day": start_date}]
+
+        return fetch
+
+
+def test_collect_oura_data_fetches_endpoints_concurrently(collector):
+    client = _SlowClient()
+    data_types = {flag: True for flag, *_ in collector.OURA_ENDPOINTS}
+    data_types["heart_rate"] = False
+
+    data = collector.collect_oura_data(
+        client, {"start_date": "2025-10-01", "end_date": "2025-10-02"}, data_types
+    )
+
+    assert list(data) == ["sleep", "sleep_periods", "activity", "readiness", "sessions", "workouts"]
+    assert data["activity"] == [{"endpoint": "get_daily_activity", "day": "2025-10-01"}]
+    assert client.peak > 1
+
+
+def test_get_resident_token_reads_file_without_touching_environ(collector, tmp_path, monkeypatch):
+    monkeypatch.delenv("PERSONAL_ACCESS_TOKEN", raising=False)
+    (tmp_path / "pat_r1.env").write_text("PERSONAL_ACCESS_TOKEN=tok-1\n")
+    (tmp_path / "pat_r2.env").write_text("OTHER=1\n")
+
+    assert collector.get_resident_token(1, str(tmp_path)) == "tok-1"
+    assert collector.get_resident_token(2, str(tmp_path)) is None
+    assert "PERSONAL_ACCESS_TOKEN" not in os.environ
+
+
+def test_get_resident_token_reads_each_file_once(collector, tmp_path, monkeypatch):
+    (tmp_path / "pat_r3.env").write_text("PERSONAL_ACCESS_TOKEN=tok-3\n")
+    reads = []
+    real_dotenv_values = collector.dotenv_values
+    monkeypatch.setattr(
+        collector, "dotenv_values", lambda path: reads.append(path) or real_dotenv_values(path)
+    )
+
+    monkeypatch.chdir(tmp_path)
+    assert collector.get_resident_token(3, str(tmp_path)) == "tok-3"
+    assert collector.get_resident_token(3, ".") == "tok-3"
+    assert len(reads) == 1
+
+
+def test_save_data_creates_output_dirs_once(collector, tmp_path, monkeypatch):
+    paths = {
+        "json_subdir": "json",
+        "csv_subdir": "csv",
+        "separate_subdir": "separate",
+        "combined_subdir": "combined",
+    }
+    made = []
+    real_mkdir = Path.mkdir
+    monkeypatch.setattr(
+        Path, "mkdir", lambda self, *a, **kw: made.append(self) or real_mkdir(self, *a, **kw)
+    )
+
+    collector.save_data(1, {}, tmp_path, paths, {})
+    first_save = list(made)
+    for resident_no in (2, 3):
+        collector.save_data(resident_no, {}, tmp_path, paths, {})
+
+    assert made == first_save
+    assert {tmp_path / "csv", tmp_path / "json/combined", tmp_path / "json/separate"} <= set(made)
+    assert (tmp_path / "json" / "separate").is_dir()
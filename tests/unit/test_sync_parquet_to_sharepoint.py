@@ -0,0 +1,286 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import scripts.sync_parquet_to_sharepoint as mod
+
+
+class _FakeBucket:
+    name = "bucket"
+
+
+class _FakeGCS:
+    def __init__(self, blobs, fail=()):
+        self.bucket = _FakeBucket()
+        self._blobs = blobs
+        self._fail = set(fail)
+
+    def list_parquet_files(self, source, date_str):
+        return list(self._blobs.get(source, []))
+
+    def blob_size(self, blob_name):
+        return 10
+
+    def download_file(self, blob_name):
+        if blob_name in self._fail:
+            raise IOError("boom")
+        return b"x" * 10
+
+
+class _FakeSharePoint:
+    SIMPLE_UPLOAD_MAX_BYTES = 4 * 1024 * 1024
+
+    def __init__(self):
+        self.uploads = []
+        self.folders = []
+
+    def _get_folder_path(self, source, date_str):
+        return f"base/{source}/{date_str}"
+
+    def _ensure_folder_exists(self, folder_path):
+        self.folders.append(folder_path)
+
+    def upload_stream(self, file_obj, file_size, filename, source, date_str, dry_run=False):
+        self.uploads.append((source, filename))
+        return True
+
+    def upload_file(self, file_content, filename, source, date_str, dry_run=False):
+        return self.upload_stream(None, len(file_content), filename, source, date_str, dry_run)
+
+
+def test_sync_date_transfers_concurrently_and_keeps_manifest_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    blobs = {
+        "TSI": [f"raw/source=TSI/agg=raw/dt=2025-12-15/t{i}.parquet" for i in range(5)],
+        "WU": ["raw/source=WU/agg=raw/dt=2025-12-15/w0.parquet"],
+    }
+    gcs = _FakeGCS(blobs, fail={blobs["TSI"][2]})
+    sharepoint = _FakeSharePoint()
+
+    success, total = mod.sync_date(
+        gcs, sharepoint, "2025-12-15", ["TSI", "WU", "PA"], max_workers=4
+    )
+
+    assert (success, total) == (5, 6)
+    assert sharepoint.folders == ["base/TSI/2025-12-15", "base/WU/2025-12-15"]
+
+    manifest = json.loads((tmp_path / "sync_manifest_2025-12-15.json").read_text())
+    entries = manifest["files"]
+    assert [e["filename"] for e in entries] == [
+        "t0.parquet", "t1.parquet", "t2.parquet", "t3.parquet", "t4.parquet", "w0.parquet"
+    ]
+    assert entries[2]["upload_status"] == "download_failed"
+
+    health = json.loads((tmp_path / "sync_health_2025-12-15.json").read_text())
+    assert health["missing_source_files"] == ["PA"]
+    assert health["totals"]["failed_uploads"] == 1
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.headers = {}
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+
+class _FakeGraphSession:
+    """Graph stand-in where only the base folder exists up front."""
+
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url))
+        if method == "POST":
+            parent = url.split("root:/", 1)[1].rsplit(":/children", 1)[0]
+            self.existing.add(f"{parent}/{kwargs['json']['name']}")
+            return _FakeResponse(201)
+        path = url.split("root:/", 1)[1]
+        if path in self.existing:
+            return _FakeResponse(200, {"name": path})
+        return _FakeResponse(404)
+
+
+def test_ensure_folder_exists_caches_confirmed_paths():
+    uploader = mod.SharePointUploader("token", "site", "drive", "base")
+    uploader.session = _FakeGraphSession({"base"})
+
+    uploader._ensure_folder_exists("base/TSI/2025-12-15")
+    first_calls = len(uploader.session.calls)
+    assert {"base", "base/TSI", "base/TSI/2025-12-15"} <= uploader._known_folders
+
+    assert uploader._ensure_folder_exists("base/TSI/2025-12-15") is None
+    assert len(uploader.session.calls) == first_calls
+
+    # A sibling date skips the probes for its already-known ancestors.
+    uploader._ensure_folder_exists("base/TSI/2025-12-16")
+    sibling_gets = [
+        url for method, url in uploader.session.calls[first_calls:] if method == "GET"
+    ]
+    assert all(url.endswith("2025-12-16") for url in sibling_gets)
+
+
+class _ChunkRecordingSession:
+    def __init__(self):
+        self.ranges = []
+
+    def request(self, method, url, timeout=None, headers=None, data=None, **kwargs):
+        if url.endswith(":/createUploadSession"):
+            return _FakeResponse(200, {"uploadUrl": "https://upload.example/session"})
+        self.ranges.append((headers["Content-Range"], len(data)))
+        start_end, total = headers["Content-Range"].split()[1].split("/")
+        last_chunk = int(start_end.split("-")[1]) == int(total) - 1
+        return _FakeResponse(201 if last_chunk else 202)
+
+
+def test_upload_stream_reads_large_files_one_chunk_at_a_time():
+    uploader = mod.SharePointUploader("token", "site", "drive", "base")
+    uploader._known_folders.add("base/TSI/2025-12-15")
+    uploader.session = uploader.upload_session = _ChunkRecordingSession()
+
+    chunk = uploader.CHUNK_UPLOAD_SIZE_BYTES
+    assert chunk % (320 * 1024) == 0
+    size = 2 * chunk + 100
+    ok = uploader.upload_stream(
+        io.BytesIO(b"x" * size), size, "big.parquet", "TSI", "2025-12-15"
+    )
+
+    assert ok
+    assert uploader.session.ranges == [
+        (f"bytes 0-{chunk - 1}/{size}", chunk),
+        (f"bytes {chunk}-{2 * chunk - 1}/{size}", chunk),
+        (f"bytes {2 * chunk}-{size - 1}/{size}", 100),
+    ]
+
+
+def test_ensure_folder_exists_creates_each_folder_once_under_concurrency():
+    uploader = mod.SharePointUploader("token", "site", "drive", "base")
+    uploader.session = _FakeGraphSession({"base"})
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(uploader._ensure_folder_exists, ["base/TSI/2025-12-15"] * 16))
+
+    posts = [url for method, url in uploader.session.calls if method == "POST"]
+    assert len(posts) == 2  # base/TSI, then base/TSI/2025-12-15
+
+
+class _ListingBucket:
+    name = "bucket"
+
+    def __init__(self, names):
+        self._names = names
+        self.calls = []
+
+    def list_blobs(self, **kwargs):
+        self.calls.append(kwargs)
+        return [SimpleNamespace(name=n, size=10) for n in self._names]
+
+
+def test_list_parquet_files_range_groups_one_listing_by_date():
+    downloader = mod.GCSDownloader.__new__(mod.GCSDownloader)
+    downloader.prefix = "raw"
+    downloader._sizes = {}
+    downloader.bucket = _ListingBucket(
+        [
+            "raw/source=TSI/agg=raw/dt=2025-12-15/a.parquet",
+            "raw/source=TSI/agg=raw/dt=2025-12-15/b.parquet",
+            "raw/source=TSI/agg=raw/dt=2025-12-16/c.parquet",
+            "raw/source=TSI/agg=raw/dt=2025-12-16/_SUCCESS",
+        ]
+    )
+
+    by_date = downloader.list_parquet_files_range("TSI", "2025-12-15", "2025-12-16")
+
+    assert by_date == {
+        "2025-12-15": [
+            "raw/source=TSI/agg=raw/dt=2025-12-15/a.parquet",
+            "raw/source=TSI/agg=raw/dt=2025-12-15/b.parquet",
+        ],
+        "2025-12-16": ["raw/source=TSI/agg=raw/dt=2025-12-16/c.parquet"],
+    }
+    (call,) = downloader.bucket.calls
+    assert call["start_offset"] == "raw/source=TSI/agg=raw/dt=2025-12-15/"
+    assert call["end_offset"] == "raw/source=TSI/agg=raw/dt=2025-12-17/"
+    assert downloader.blob_size("raw/source=TSI/agg=raw/dt=2025-12-16/c.parquet") == 10
+
+
+def test_sync_date_uses_prelisted_blobs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    gcs = _FakeGCS({})
+    gcs.list_parquet_files = None  # must not be called for pre-listed sources
+    sharepoint = _FakeSharePoint()
+    listings = {"TSI": {"2025-12-15": ["raw/source=TSI/agg=raw/dt=2025-12-15/t.parquet"]}}
+
+    success, total = mod.sync_date(
+        gcs, sharepoint, "2025-12-15", ["TSI"], listings=listings
+    )
+
+    assert (success, total) == (1, 1)
+
+
+def test_parse_date_is_memoized_and_still_validates():
+    assert mod.parse_date("2025-12-15") is mod.parse_date("2025-12-15")
+    with pytest.raises(ValueError, match="Expected YYYY-MM-DD"):
+        mod.parse_date("12/15/2025")
+
+
+@pytest.mark.parametrize("value", ["2025-W01-1", "20251215", "2025-12-15T01:00", "2025/12/15"])
+def test_parse_date_rejects_forms_strptime_rejected(value):
+    with pytest.raises(ValueError, match="Expected YYYY-MM-DD"):
+        mod.parse_date(value)
+
+
+def test_parse_date_still_accepts_unpadded_like_strptime():
+    assert mod.parse_date("2025-6-1") == datetime(2025, 6, 1)
+
+
+def test_get_date_range_is_inclusive_across_month_end():
+    assert mod.get_date_range("2024-02-28", "2024-03-01") == [
+        "2024-02-28",
+        "2024-02-29",
+        "2024-03-01",
+    ]
+
+
+def test_rate_limiter_spaces_requests_after_burst(monkeypatch):
+    clock = {"now": 100.0}
+    sleeps = []
+    monkeypatch.setattr(mod.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(mod.time, "sleep", sleeps.append)
+
+    limiter = mod._RateLimiter(rate=10, burst=2)
+    for _ in range(4):
+        limiter.acquire()
+
+    # Two burst tokens are free; the next callers queue 0.1s apart.
+    assert sleeps == [0.1, 0.2]
+
+
+def test_sync_date_skip_existing_avoids_transfer_of_matching_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    blobs = {"TSI": [f"raw/source=TSI/agg=raw/dt=2025-12-15/t{i}.parquet" for i in range(2)]}
+    gcs = _FakeGCS(blobs)
+    sharepoint = _FakeSharePoint()
+    # t0 is already there with the same size; t1 is stale.
+    sharepoint.remote_file_size = lambda filename, source, date_str: (
+        10 if filename == "t0.parquet" else 3
+    )
+
+    success, total = mod.sync_date(
+        gcs, sharepoint, "2025-12-15", ["TSI"], skip_existing=True
+    )
+
+    assert (success, total) == (2, 2)
+    assert ("TSI", "t0.parquet") not in sharepoint.uploads
+    assert ("TSI", "t1.parquet") in sharepoint.uploads
+    manifest = json.loads((tmp_path / "sync_manifest_2025-12-15.json").read_text())
+    assert manifest["files"][0]["upload_status"] == "skipped_existing"
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+import pytest
+
+from src.utils.tsi_date_manager import TSIDateRangeManager
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2025-06-13", "20250613", "2025/06/13", "2025-6-13"],
+)
+def test_parse_date_accepts_supported_formats(value):
+    assert TSIDateRangeManager._parse_date(value) == datetime(2025, 6, 13)
+
+
+@pytest.mark.parametrize("value", ["2025-13-01", "2025-06/13", "06/13/2025", "not-a-date"])
+def test_parse_date_rejects_invalid_dates(value):
+    with pytest.raises(ValueError, match="Unable to parse date"):
+        TSIDateRangeManager._parse_date(value)
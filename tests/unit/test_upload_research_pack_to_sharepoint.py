@@ -0,0 +1,38 @@
+import sys
+
+import scripts.upload_research_pack_to_sharepoint as mod
+
+
+class _FakeUploader:
+    instances = []
+
+    def __init__(self, access_token, site_id, drive_id, base_folder):
+        self.streamed = []
+        _FakeUploader.instances.append(self)
+
+    def upload_stream(self, file_obj, file_size, filename, source, date_str, dry_run=False):
+        self.streamed.append((filename, file_size, len(file_obj.read()), source, date_str))
+        return True
+
+
+def test_main_streams_each_file_from_disk(tmp_path, monkeypatch):
+    date_dir = tmp_path / "2025-12-15"
+    date_dir.mkdir()
+    (date_dir / "b.csv").write_bytes(b"x" * 7)
+    (date_dir / "a.parquet").write_bytes(b"y" * 3)
+    (date_dir / "nested").mkdir()
+
+    monkeypatch.setenv("SHAREPOINT_SITE_ID", "site")
+    monkeypatch.setenv("SHAREPOINT_DRIVE_ID", "drive")
+    monkeypatch.setattr(mod, "get_sharepoint_access_token", lambda: "token")
+    monkeypatch.setattr(mod, "SharePointUploader", _FakeUploader)
+    monkeypatch.setattr(
+        sys, "argv", ["prog", "--input-dir", str(tmp_path), "--date", "2025-12-15"]
+    )
+
+    assert mod.main() == 0
+    (uploader,) = _FakeUploader.instances
+    assert uploader.streamed == [
+        ("a.parquet", 3, 3, "_research_pack", "2025-12-15"),
+        ("b.csv", 7, 7, "_research_pack", "2025-12-15"),
+    ]
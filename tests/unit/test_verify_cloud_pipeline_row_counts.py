@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+import scripts.verify_cloud_pipeline as mod
+
+
+class _FakeJob:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def result(self):
+        return self._rows
+
+
+class _FakeClient:
+    project = "proj"
+
+    def __init__(self):
+        self.queries = []
+
+    def query(self, query, job_config=None):
+        self.queries.append(query)
+        if "__TABLES__" in query:
+            return _FakeJob([{"table_id": "sensor_readings", "row_count": 42}])
+        return _FakeJob([{"cnt": 7}])
+
+
+def _args(date=None):
+    return SimpleNamespace(
+        check_rows=True,
+        show_schema=False,
+        enforce_normalized=False,
+        epoch_diagnostics=False,
+        dataset="sensors",
+        date=date,
+    )
+
+
+def test_undated_row_counts_use_one_metadata_query():
+    client = _FakeClient()
+    out = mod.gather_row_related(client, _args(), ["sensor_readings", "readings_view"])
+    assert out["row_counts"] == {"sensor_readings": 42, "readings_view": 7}
+    assert "`proj.sensors.__TABLES__`" in client.queries[0]
+    # Only the view (absent from native table metadata) needs a COUNT(*) job.
+    assert len(client.queries) == 2
+
+
+def test_dated_row_counts_skip_metadata_query():
+    client = _FakeClient()
+    mod.gather_row_related(client, _args(date="2025-01-01"), ["readings_20250101"])
+    assert not any("__TABLES__" in q for q in client.queries)